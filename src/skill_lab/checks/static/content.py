@@ -18,6 +18,9 @@ CODE_EXAMPLE_PATTERNS = [
     r"<example>",  # Example tags
 ]
 
+# All example patterns as one alternation, so a body is scanned in a single pass
+CODE_EXAMPLE_RE = re.compile("|".join(f"(?:{p})" for p in CODE_EXAMPLE_PATTERNS), re.MULTILINE)
+
 # Maximum nesting depth for references
 MAX_REFERENCE_DEPTH = 1
 
@@ -93,14 +96,11 @@ class HasExamplesCheck(StaticCheck):
     dimension: ClassVar[EvalDimension] = EvalDimension.CONTENT
 
     def run(self, skill: Skill) -> CheckResult:
-        body = skill.body
-
-        for pattern in CODE_EXAMPLE_PATTERNS:
-            if re.search(pattern, body, re.MULTILINE):
-                return self._pass(
-                    "Content contains code examples",
-                    location=self._skill_md_location(skill),
-                )
+        if CODE_EXAMPLE_RE.search(skill.body):
+            return self._pass(
+                "Content contains code examples",
+                location=self._skill_md_location(skill),
+            )
 
         return self._fail(
             "Content does not contain code examples",
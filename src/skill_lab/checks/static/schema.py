@@ -48,7 +48,7 @@ class FieldRule:
     max_length: int | None = None
     not_blank: bool = False
     blank_fail_message: str = ""
-    regex_pattern: str | None = None
+    regex_pattern: re.Pattern[str] | None = None
     regex_fail_message: str = ""
     no_consecutive: str | None = None
     no_consecutive_message: str = ""
@@ -99,7 +99,7 @@ FRONTMATTER_SCHEMA: list[FieldRule] = [
         source="metadata",
         required=True,
         max_length=64,
-        regex_pattern=r"^[a-z0-9][a-z0-9-]*[a-z0-9]$|^[a-z0-9]$",
+        regex_pattern=re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$|^[a-z0-9]$"),
         regex_fail_message=(
             "Name must be lowercase letters, numbers, and hyphens only, "
             "and must not start or end with a hyphen"
@@ -309,7 +309,7 @@ def _validate_rule(check: StaticCheck, skill: Skill, rule: FieldRule) -> CheckRe
     if (
         rule.regex_pattern is not None
         and isinstance(value, str)
-        and not re.match(rule.regex_pattern, value)
+        and not rule.regex_pattern.match(value)
     ):
         errors.append(rule.regex_fail_message)
 
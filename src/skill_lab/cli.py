@@ -18,6 +18,7 @@ from skill_lab.evaluators.static_evaluator import StaticEvaluator
 from skill_lab.evaluators.trace_evaluator import TraceEvaluator
 from skill_lab.reporters.console_reporter import SEVERITY_STYLES, ConsoleReporter
 from skill_lab.reporters.json_reporter import JsonReporter
+from skill_lab.runtimes.base import format_trace
 from skill_lab.triggers.trigger_evaluator import TriggerEvaluator
 
 app = typer.Typer(
@@ -307,6 +308,18 @@ def trigger(
             help="Output format",
         ),
     ] = OutputFormat.console,
+    concurrency: Annotated[
+        int | None,
+        typer.Option(
+            "--concurrency",
+            "-j",
+            min=1,
+            help=(
+                "Maximum tests to run in parallel (default: available CPUs minus 2). "
+                "Tests share the working directory; files_created tests run alone."
+            ),
+        ),
+    ] = None,
 ) -> None:
     """Run trigger tests to verify skill activation.
 
@@ -347,7 +360,7 @@ def trigger(
             raise typer.Exit(code=1) from None
 
     # Run evaluation with progress display
-    evaluator = TriggerEvaluator(runtime=runtime)
+    evaluator = TriggerEvaluator(runtime=runtime, concurrency=concurrency)
 
     with console.status("", spinner="dots") as status:
 
@@ -501,11 +514,10 @@ def generate(
     resolved_model = model or os.environ.get("SKLAB_MODEL") or None
 
     try:
-        kwargs: dict[str, str] = {}
         if resolved_model:
-            kwargs["model"] = resolved_model
-
-        generator = TriggerGenerator(api_key=api_key, **kwargs)
+            generator = TriggerGenerator(model=resolved_model, api_key=api_key)
+        else:
+            generator = TriggerGenerator(api_key=api_key)
 
         with console.status("[cyan]Generating trigger tests...[/cyan]", spinner="dots"):
             written_path = generator.generate_and_write(skill_path, force=force)
@@ -515,9 +527,9 @@ def generate(
         raise typer.Exit(code=1) from None
 
     # Print summary
-    import yaml
+    from skill_lab.core.utils import yaml_safe_load
 
-    content = yaml.safe_load(written_path.read_text())
+    content = yaml_safe_load(written_path.read_text())
     test_cases = content.get("test_cases", [])
     type_counts: dict[str, int] = {}
     for tc in test_cases:
@@ -623,6 +635,42 @@ def eval_trace(
         raise typer.Exit(code=1)
 
 
+@app.command("format-trace")
+def format_trace_command(
+    trace: Annotated[
+        Path,
+        typer.Argument(
+            help="Path to a JSONL trace file (e.g. .skill-lab/traces/<test-id>.jsonl)",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            resolve_path=True,
+        ),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Output file path (defaults to printing to the terminal)",
+        ),
+    ] = None,
+) -> None:
+    """Pretty-print a JSONL execution trace for reading.
+
+    Traces are stored as compact JSONL exactly as the runtime emitted them.
+    This command expands each event into indented JSON separated by blank lines.
+    Traces already pretty-printed by older versions are re-formatted the same way.
+    """
+    formatted = format_trace(trace.read_text(encoding="utf-8"))
+
+    if output:
+        output.write_text(formatted, encoding="utf-8")
+        console.print(f"Formatted trace written to: {output}")
+    else:
+        console.print(formatted, markup=False, highlight=False, soft_wrap=True, end="")
+
+
 def main() -> None:
     """Entry point for the CLI."""
     app()
@@ -123,7 +123,7 @@ class EvaluationReport:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TraceEvent:
     """Normalized event from any runtime (Codex or Claude).
 
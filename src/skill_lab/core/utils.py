@@ -1,11 +1,108 @@
 """Shared utilities for the skill-lab framework."""
 
+import json
+import os
 from collections.abc import Callable
-from typing import Generic, TypeVar
+from typing import IO, Any, Generic, TypeVar
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 T = TypeVar("T")
 
 
+def json_loads(data: bytes | str) -> Any:
+    """Decode a JSON document, using orjson when it is installed.
+
+    Both backends raise json.JSONDecodeError (orjson's error subclasses it),
+    including for bytes that are not valid UTF-8, so callers can catch the
+    stdlib exception regardless of backend.
+
+    Args:
+        data: JSON text as bytes or str. Bytes must be UTF-8; they skip a
+            decode with orjson.
+
+    Returns:
+        The decoded Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        try:
+            data = data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise json.JSONDecodeError(
+                f"Invalid UTF-8: {e.reason}", data.decode("utf-8", "replace"), e.start
+            ) from e
+    return json.loads(data)
+
+
+def json_dumps_pretty(obj: Any) -> str:
+    """Serialize an object as JSON indented by two spaces.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        Pretty-printed JSON string.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def yaml_safe_load(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """Parse YAML with the safe loader, using the libyaml C parser when available.
+
+    Equivalent to yaml.safe_load(); errors are raised as yaml.YAMLError.
+
+    Args:
+        stream: YAML text or an open file.
+
+    Returns:
+        The parsed Python object.
+    """
+    return yaml.load(stream, Loader=_YamlLoader)
+
+
+def yaml_safe_dump(data: Any, **kwargs: Any) -> str:
+    """Serialize plain data to YAML, using the libyaml C emitter when available.
+
+    Equivalent to yaml.safe_dump(); keyword arguments are passed through.
+
+    Args:
+        data: Plain Python data (dicts, lists, scalars).
+        **kwargs: Formatting options such as sort_keys or allow_unicode.
+
+    Returns:
+        The YAML document as a string.
+    """
+    text: str = yaml.dump(data, Dumper=_YamlDumper, **kwargs)
+    return text
+
+
+def available_cpus() -> int:
+    """Return the number of CPUs this process may run on.
+
+    Respects CPU affinity (e.g., container or taskset limits) where the
+    platform supports it, falling back to os.cpu_count().
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
 class Registry(Generic[T]):
     """Generic registry for managing registered items.
 
@@ -15,7 +15,7 @@ from skill_lab.checks.static import (  # noqa: F401
     schema,
     structure,
 )
-from skill_lab.core.models import CheckResult, EvaluationReport, Severity
+from skill_lab.core.models import CheckResult, EvaluationReport, Severity, Skill
 from skill_lab.core.registry import registry
 from skill_lab.core.scoring import build_summary, calculate_metrics, calculate_score
 from skill_lab.parsers.skill_parser import parse_skill
@@ -75,6 +75,32 @@ class StaticEvaluator:
         # Parse the skill
         skill = parse_skill(skill_path)
 
+        return self._evaluate_parsed(skill, start_time)
+
+    def evaluate_skill(self, skill: Skill) -> EvaluationReport:
+        """Evaluate an already-parsed skill.
+
+        Use this to run checks repeatedly against one skill without
+        re-reading it from disk.
+
+        Args:
+            skill: Skill returned by parse_skill().
+
+        Returns:
+            EvaluationReport with all check results.
+        """
+        return self._evaluate_parsed(skill, time.perf_counter())
+
+    def _evaluate_parsed(self, skill: Skill, start_time: float) -> EvaluationReport:
+        """Run the checks on a parsed skill and build the report.
+
+        Args:
+            skill: The parsed skill.
+            start_time: perf_counter() value the reported duration is measured from.
+
+        Returns:
+            EvaluationReport with all check results.
+        """
         # Run all checks
         results: list[CheckResult] = []
         checks = self._get_checks()
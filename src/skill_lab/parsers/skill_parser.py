@@ -7,6 +7,7 @@ from typing import Any
 import yaml
 
 from skill_lab.core.models import Skill, SkillMetadata
+from skill_lab.core.utils import yaml_safe_load
 
 # Regex pattern for YAML frontmatter
 # Allows empty frontmatter (---\n---) as well as content between markers
@@ -33,7 +34,7 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str, list[st
     body = content[match.end() :]
 
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
+        frontmatter = yaml_safe_load(frontmatter_text)
         if frontmatter is None:
             frontmatter = {}
         if not isinstance(frontmatter, dict):
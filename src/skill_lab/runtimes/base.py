@@ -1,12 +1,100 @@
 """Abstract base class for runtime adapters."""
 
+import functools
 import json
+import os
+import shutil
+import subprocess
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Collection, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
 from skill_lab.core.models import TraceEvent
+from skill_lab.core.utils import json_dumps_pretty, json_loads
+
+# Bytes at the head of a trace chunk searched for its "type" key
+_TYPE_PROBE_WINDOW = 80
+
+
+def format_trace(raw_output: str) -> str:
+    """Format JSONL trace output for human readability.
+
+    Converts each JSON object to pretty-printed format with blank lines
+    between objects. Accepts both compact JSONL and the pretty-printed
+    traces older versions of skill-lab wrote to disk.
+
+    Args:
+        raw_output: Raw trace contents, as stored by the runtime adapters.
+
+    Returns:
+        Formatted trace string with pretty-printed JSON objects.
+    """
+    formatted_objects: list[str] = []
+    for chunk in _iter_json_chunks(raw_output.encode("utf-8").splitlines(keepends=True)):
+        try:
+            obj = json_loads(chunk)
+            formatted_objects.append(json_dumps_pretty(obj))
+        except json.JSONDecodeError:
+            # Keep malformed chunks as-is
+            formatted_objects.append(chunk.decode("utf-8").strip())
+
+    return "\n\n".join(formatted_objects) + "\n" if formatted_objects else ""
+
+
+def _iter_json_chunks(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """Group trace lines into the encoded JSON objects they contain.
+
+    A complete object starting at column 0 is a compact JSONL line; other
+    non-blank lines are accumulated as a pretty-printed object until a
+    blank line ends it.
+
+    Args:
+        lines: Trace lines as bytes, with or without line endings.
+
+    Yields:
+        Raw bytes of each JSON object (compact line or formatted block).
+    """
+    buffer: list[bytes] = []
+    for line in lines:
+        stripped = line.strip()
+        # A complete object starting at column 0 is a compact JSONL line
+        if line.startswith(b"{") and stripped.endswith(b"}"):
+            if buffer:
+                yield b"".join(buffer)
+                buffer.clear()
+            yield stripped
+        elif stripped:
+            # Part of a pretty-printed object
+            buffer.append(line)
+        elif buffer:
+            # Blank line terminates a pretty-printed object
+            yield b"".join(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield b"".join(buffer)
+
+
+@functools.lru_cache(maxsize=8)
+def _which(name: str, path_env: str) -> str | None:
+    """Cached shutil.which lookup, keyed on the PATH it searched."""
+    return shutil.which(name, path=path_env)
+
+
+def resolve_cli(name: str) -> str | None:
+    """Resolve a runtime CLI executable on PATH.
+
+    Lookups are memoized per (name, PATH), so repeated availability checks
+    and executions skip the filesystem walk. A changed PATH is a new key.
+
+    Args:
+        name: Executable name (e.g., 'claude', 'codex').
+
+    Returns:
+        Full path to the executable (handles Windows .CMD files), or None.
+    """
+    return _which(name, os.environ.get("PATH", os.defpath))
 
 
 class RuntimeAdapter(ABC):
@@ -75,39 +163,128 @@ class RuntimeAdapter(ABC):
         """
         return True
 
-    def _format_trace(self, raw_output: str) -> str:
-        """Format raw JSONL output for human readability.
+    def _check_skill_trigger(self, line: bytes, skill_name: str) -> bool:
+        """Check if a streamed output line indicates the skill was triggered.
 
-        Converts compact single-line JSON objects to pretty-printed format
-        with blank lines between objects.
+        Override this to support early termination via stop_on_skill.
+        Default implementation never reports a trigger.
+
+        Only lines containing skill_name are passed in: every trigger
+        pattern includes the skill name, so other lines are rejected
+        before any JSON decoding.
 
         Args:
-            raw_output: Raw JSONL string from CLI.
+            line: A single line of JSONL output, as undecoded bytes
+                (including its trailing newline).
+            skill_name: The skill name to look for.
 
         Returns:
-            Formatted trace string with pretty-printed JSON objects.
+            True if the skill was triggered in this event.
         """
-        formatted_objects: list[str] = []
-        for line in raw_output.strip().split("\n"):
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-                formatted_objects.append(json.dumps(obj, indent=2))
-            except json.JSONDecodeError:
-                # Keep malformed lines as-is
-                formatted_objects.append(line)
+        return False
 
-        return "\n\n".join(formatted_objects) + "\n" if formatted_objects else ""
+    def _run_and_capture(
+        self,
+        command: list[str],
+        cwd: Path,
+        trace_path: Path,
+        stop_on_skill: str | None = None,
+    ) -> int:
+        """Run a runtime CLI and capture its JSONL stdout as the trace.
+
+        Lines are stored exactly as the CLI emitted them (compact JSONL);
+        use format_trace() or `sklab format-trace` to pretty-print a trace.
+
+        Args:
+            command: Full command line, starting with the resolved CLI path.
+            cwd: Directory to run the command from.
+            trace_path: Where to write the JSONL trace.
+            stop_on_skill: If provided, terminate early when this skill
+                is triggered.
+
+        Returns:
+            Exit code from the CLI, or 0 if terminated early on skill trigger.
+        """
+        try:
+            # Lines are appended to the trace as they arrive, so memory use
+            # stays bounded by the longest line rather than the whole trace
+            with trace_path.open("wb") as trace_file:
+                # Use streaming with Popen for early termination support. stdout
+                # stays binary: lines are stored and JSON-decoded as raw bytes.
+                # stderr is never read, so discard it rather than let a full
+                # pipe buffer block the CLI.
+                proc = subprocess.Popen(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    cwd=cwd,
+                )
+
+                skill_triggered = False
+                skill_needle = stop_on_skill.encode() if stop_on_skill else None
+
+                # Stream stdout and check for skill trigger
+                for line in proc.stdout or []:
+                    # Lines keep their newline: the trace is written verbatim
+                    # and JSON decoding ignores trailing whitespace
+                    if line == b"\n":
+                        continue
+                    if not line.endswith(b"\n"):
+                        # Final line of output without a terminator
+                        line += b"\n"
+                    trace_file.write(line)
+
+                    # Check if we should stop early. The substring test rejects most
+                    # lines (text deltas, status events) without decoding them.
+                    if (
+                        stop_on_skill
+                        and skill_needle
+                        and skill_needle in line
+                        and self._check_skill_trigger(line, stop_on_skill)
+                    ):
+                        skill_triggered = True
+                        proc.terminate()
+                        try:
+                            proc.wait(timeout=1)
+                        except subprocess.TimeoutExpired:
+                            proc.kill()
+                        break
+
+                # Wait for process to complete if not terminated
+                if proc.poll() is None:
+                    try:
+                        proc.wait(timeout=300)
+                    except subprocess.TimeoutExpired:
+                        proc.kill()
+                        trace_file.write(b'{"type": "error", "message": "Execution timed out"}\n')
+
+            # Return 0 if we terminated early due to skill trigger (success)
+            if skill_triggered:
+                return 0
+            return proc.returncode or 0
 
-    def _parse_trace_chunks(self, trace_path: Path) -> Iterator[dict[str, Any]]:
+        except Exception as e:
+            error_event = {"type": "error", "message": f"Execution failed: {e}"}
+            trace_path.write_text(json.dumps(error_event) + "\n", encoding="utf-8")
+            return 1
+
+    def _parse_trace_chunks(
+        self,
+        trace_path: Path,
+        skip_types: Collection[str] = (),
+    ) -> Iterator[dict[str, Any]]:
         """Parse trace file into raw JSON objects.
 
         Handles both compact JSONL (one object per line) and formatted
-        traces (multi-line pretty-printed JSON with blank line separators).
+        traces (multi-line pretty-printed JSON with blank line separators),
+        which older versions of skill-lab wrote to disk.
 
         Args:
             trace_path: Path to the trace file.
+            skip_types: Event types to drop before decoding. The first bytes of
+                each chunk are matched, so skipped events never become dicts.
+                Callers should still check the decoded type, as an event whose
+                "type" key is not near the start is not caught by the probe.
 
         Yields:
             Parsed JSON objects from the trace.
@@ -115,16 +292,38 @@ class RuntimeAdapter(ABC):
         if not trace_path.exists():
             return
 
-        content = trace_path.read_text()
-
-        # Split by double newline (formatted) or single newline (compact JSONL)
-        chunks = content.split("\n\n") if "\n\n" in content else content.strip().split("\n")
+        # Match both compact ("type":"x") and json.dumps-style ("type": "x") output
+        skip_probes = tuple(
+            probe
+            for event_type in skip_types
+            for probe in (f'"type":"{event_type}"'.encode(), f'"type": "{event_type}"'.encode())
+        )
 
-        for chunk in chunks:
-            chunk = chunk.strip()
-            if not chunk:
-                continue
+        for chunk in self._iter_trace_chunks(trace_path):
+            if skip_probes:
+                # Runtimes emit "type" as the first key, so only the head of the
+                # chunk is probed; payload text further in is never scanned
+                head = chunk[:_TYPE_PROBE_WINDOW]
+                if any(probe in head for probe in skip_probes):
+                    continue
             try:
-                yield json.loads(chunk)
+                yield json_loads(chunk)
             except json.JSONDecodeError:
                 continue
+
+    @staticmethod
+    def _iter_trace_chunks(trace_path: Path) -> Iterator[bytes]:
+        """Yield the encoded JSON objects of a trace file one at a time.
+
+        Streams the file line by line, so only the current object is held
+        in memory. Bytes are yielded as-is; the JSON decoder accepts them
+        directly, skipping a UTF-8 decode.
+
+        Args:
+            trace_path: Path to the trace file.
+
+        Yields:
+            Raw bytes of each JSON object (compact line or formatted block).
+        """
+        with trace_path.open("rb") as f:
+            yield from _iter_json_chunks(f)
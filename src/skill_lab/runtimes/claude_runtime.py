@@ -1,15 +1,13 @@
 """Claude Code runtime adapter for executing skills."""
 
-import json
-import shutil
-import subprocess
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
 from skill_lab.core.constants import skill_script_patterns
 from skill_lab.core.models import TraceEvent
-from skill_lab.runtimes.base import RuntimeAdapter
+from skill_lab.core.utils import json_loads
+from skill_lab.runtimes.base import RuntimeAdapter, resolve_cli
 
 
 class ClaudeRuntime(RuntimeAdapter):
@@ -52,77 +50,23 @@ class ClaudeRuntime(RuntimeAdapter):
         cwd = working_dir if working_dir is not None else skill_path
 
         # Get full path to handle Windows .CMD files
-        claude_path = shutil.which("claude")
+        claude_path = resolve_cli("claude")
         if claude_path is None:
             trace_path.write_text('{"type": "error", "message": "Claude CLI not found"}\n')
             return 127
 
-        try:
-            # Use streaming with Popen for early termination support
-            proc = subprocess.Popen(
-                [
-                    claude_path,
-                    "--print",  # Output mode
-                    "--verbose",  # Required for stream-json output
-                    "--output-format",
-                    "stream-json",
-                    "-p",
-                    prompt,
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=cwd,
-            )
-
-            captured_lines: list[str] = []
-            skill_triggered = False
-
-            # Stream stdout and check for skill trigger
-            for line in proc.stdout or []:
-                line = line.rstrip("\n")
-                if not line:
-                    continue
-                captured_lines.append(line)
-
-                # Check if we should stop early
-                if (
-                    stop_on_skill
-                    and not skill_triggered
-                    and self._check_skill_trigger(line, stop_on_skill)
-                ):
-                    skill_triggered = True
-                    proc.terminate()
-                    try:
-                        proc.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        proc.kill()
-                    break
-
-            # Wait for process to complete if not terminated
-            if proc.poll() is None:
-                try:
-                    proc.wait(timeout=300)
-                except subprocess.TimeoutExpired:
-                    proc.kill()
-                    captured_lines.append('{"type": "error", "message": "Execution timed out"}')
-
-            # Format trace for readability
-            formatted_trace = self._format_trace("\n".join(captured_lines))
-            trace_path.write_text(formatted_trace)
-
-            # Return 0 if we terminated early due to skill trigger (success)
-            if skill_triggered:
-                return 0
-            return proc.returncode or 0
-
-        except Exception as e:
-            trace_path.write_text(
-                f'{{\n  "type": "error",\n  "message": "Execution failed: {e}"\n}}\n'
-            )
-            return 1
-
-    def _check_skill_trigger(self, line: str, skill_name: str) -> bool:
+        command = [
+            claude_path,
+            "--print",  # Output mode
+            "--verbose",  # Required for stream-json output
+            "--output-format",
+            "stream-json",
+            "-p",
+            prompt,
+        ]
+        return self._run_and_capture(command, cwd, trace_path, stop_on_skill)
+
+    def _check_skill_trigger(self, line: bytes, skill_name: str) -> bool:
         """Check if a JSONL line indicates the skill was triggered.
 
         Looks for:
@@ -131,15 +75,16 @@ class ClaudeRuntime(RuntimeAdapter):
         3. Read operations on skill files
 
         Args:
-            line: A single line of JSONL output.
+            line: A single line of JSONL output, as undecoded bytes.
             skill_name: The skill name to look for.
 
         Returns:
             True if the skill was triggered in this event.
         """
         try:
-            event = json.loads(line)
-        except json.JSONDecodeError:
+            event = json_loads(line)
+        except ValueError:
+            # Malformed JSON or invalid UTF-8 in the raw line
             return False
 
         # Skip system init events
@@ -196,8 +141,9 @@ class ClaudeRuntime(RuntimeAdapter):
         are not useful for trace analysis - we only care about tool
         invocations and results.
         """
-        for raw in self._parse_trace_chunks(trace_path):
-            # Skip stream events (text deltas) - not useful for analysis
+        # Stream events dominate Claude traces; drop them before JSON decoding
+        for raw in self._parse_trace_chunks(trace_path, skip_types=("stream_event",)):
+            # Guard against stream events the byte probe could not match
             if raw.get("type") == "stream_event":
                 continue
             yield self._normalize_event(raw)
@@ -212,64 +158,87 @@ class ClaudeRuntime(RuntimeAdapter):
         - result: {"type": "result", ...} (final result)
 
         Tool names are PascalCase: Bash, Read, Write, Edit, Glob, Grep, etc.
+        Dispatches on the event type to a handler specialized for it.
         """
-        event_type = raw.get("type", "unknown")
-
-        # Skip stream_event (just text streaming tokens, not actions)
-        if event_type == "stream_event":
-            return TraceEvent(
-                type="stream",
-                item_type="text_delta",
-                raw=raw,
-            )
-
-        # Map Claude event types to our normalized types
-        type_mapping = {
-            "assistant": "item.completed",
-            "tool_use": "item.started",
-            "tool_result": "item.completed",
-            "message": "turn.completed",
-            "result": "turn.completed",
-        }
-
-        normalized_type = type_mapping.get(event_type) or event_type
-
-        # Extract command from tool_use events
-        command = None
-        item_type = None
-        if event_type == "tool_use":
-            tool_name = raw.get("name", "")
-            tool_input = raw.get("input", {})
-
-            # Bash tool - extract command
-            if tool_name == "Bash":
-                command = tool_input.get("command")
-                item_type = "command_execution"
-            # File operation tools
-            elif tool_name in ("Read", "Write", "Edit"):
-                item_type = "file_operation"
-                # For Write/Edit, capture the file path as context
-                command = tool_input.get("file_path")
-            # Other tools (Glob, Grep, WebFetch, etc.)
-            else:
-                item_type = tool_name.lower()
-
-        # Extract output from tool_result events
-        output = None
-        if event_type == "tool_result":
-            output = raw.get("content")
-            # tool_result doesn't carry the tool type, mark as generic
-            item_type = "tool_result"
-
-        return TraceEvent(
-            type=normalized_type,
-            item_type=item_type,
-            command=command,
-            output=output,
-            timestamp=raw.get("timestamp"),
-            raw=raw,
-        )
+        return _HANDLERS.get(raw.get("type"), _norm_default)(raw)
 
     def is_available(self) -> bool:
         """Check if Claude CLI is installed."""
-        return shutil.which("claude") is not None
+        return resolve_cli("claude") is not None
+
+
+# =============================================================================
+# Event normalization handlers, keyed by Claude event type
+# =============================================================================
+
+# Tools whose input carries a file_path, normalized as file operations
+_FILE_TOOLS = frozenset(("Read", "Write", "Edit"))
+
+
+def _norm_stream(raw: dict[str, Any]) -> TraceEvent:
+    """Normalize stream_event (text streaming tokens, not actions)."""
+    return TraceEvent(type="stream", item_type="text_delta", raw=raw)
+
+
+def _norm_tool_use(raw: dict[str, Any]) -> TraceEvent:
+    """Normalize tool_use, extracting the command or file path."""
+    tool_name = raw.get("name", "")
+    tool_input = raw.get("input", {})
+
+    # Bash tool - extract command
+    if tool_name == "Bash":
+        command = tool_input.get("command")
+        item_type = "command_execution"
+    # File operation tools
+    elif tool_name in _FILE_TOOLS:
+        item_type = "file_operation"
+        # For Write/Edit, capture the file path as context
+        command = tool_input.get("file_path")
+    # Other tools (Glob, Grep, WebFetch, etc.)
+    else:
+        command = None
+        item_type = tool_name.lower()
+
+    return TraceEvent(
+        type="item.started",
+        item_type=item_type,
+        command=command,
+        timestamp=raw.get("timestamp"),
+        raw=raw,
+    )
+
+
+def _norm_tool_result(raw: dict[str, Any]) -> TraceEvent:
+    """Normalize tool_result; it doesn't carry the tool type, so mark as generic."""
+    return TraceEvent(
+        type="item.completed",
+        item_type="tool_result",
+        output=raw.get("content"),
+        timestamp=raw.get("timestamp"),
+        raw=raw,
+    )
+
+
+def _norm_assistant(raw: dict[str, Any]) -> TraceEvent:
+    """Normalize assistant messages."""
+    return TraceEvent(type="item.completed", timestamp=raw.get("timestamp"), raw=raw)
+
+
+def _norm_turn_completed(raw: dict[str, Any]) -> TraceEvent:
+    """Normalize message and result events, which end a turn."""
+    return TraceEvent(type="turn.completed", timestamp=raw.get("timestamp"), raw=raw)
+
+
+def _norm_default(raw: dict[str, Any]) -> TraceEvent:
+    """Normalize any other event, keeping its native type."""
+    return TraceEvent(type=raw.get("type", "unknown"), timestamp=raw.get("timestamp"), raw=raw)
+
+
+_HANDLERS: dict[Any, Callable[[dict[str, Any]], TraceEvent]] = {
+    "stream_event": _norm_stream,
+    "tool_use": _norm_tool_use,
+    "tool_result": _norm_tool_result,
+    "assistant": _norm_assistant,
+    "message": _norm_turn_completed,
+    "result": _norm_turn_completed,
+}
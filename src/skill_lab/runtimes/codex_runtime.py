@@ -1,14 +1,34 @@
 """Codex CLI runtime adapter for executing skills."""
 
-import json
-import shutil
-import subprocess
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from skill_lab.core.models import TraceEvent
-from skill_lab.runtimes.base import RuntimeAdapter
+from skill_lab.core.utils import json_loads
+from skill_lab.runtimes.base import RuntimeAdapter, resolve_cli
+
+_NO_ITEM: Mapping[str, Any] = MappingProxyType({})
+
+
+def _iter_string_values(value: Any) -> Iterator[str]:
+    """Yield every string leaf of a decoded JSON value, depth first.
+
+    Args:
+        value: A decoded JSON value (dict, list, or scalar).
+
+    Yields:
+        String values found anywhere inside the value.
+    """
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for child in value.values():
+            yield from _iter_string_values(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from _iter_string_values(child)
 
 
 class CodexRuntime(RuntimeAdapter):
@@ -55,100 +75,51 @@ class CodexRuntime(RuntimeAdapter):
         cwd = working_dir if working_dir is not None else skill_path
 
         # Get full path to handle Windows .CMD files
-        codex_path = shutil.which("codex")
+        codex_path = resolve_cli("codex")
         if codex_path is None:
             trace_path.write_text('{"type": "error", "message": "Codex CLI not found"}\n')
             return 127
 
-        try:
-            # Use streaming with Popen for early termination support
-            proc = subprocess.Popen(
-                [
-                    codex_path,
-                    "exec",
-                    "--json",  # REQUIRED: emit structured events
-                    "--full-auto",  # Allow file system changes
-                    prompt,
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=cwd,
-            )
-
-            captured_lines: list[str] = []
-            skill_triggered = False
-
-            # Stream stdout and check for skill trigger
-            for line in proc.stdout or []:
-                line = line.rstrip("\n")
-                if not line:
-                    continue
-                captured_lines.append(line)
-
-                # Check if we should stop early
-                if (
-                    stop_on_skill
-                    and not skill_triggered
-                    and self._check_skill_trigger(line, stop_on_skill)
-                ):
-                    skill_triggered = True
-                    proc.terminate()
-                    try:
-                        proc.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        proc.kill()
-                    break
-
-            # Wait for process to complete if not terminated
-            if proc.poll() is None:
-                try:
-                    proc.wait(timeout=300)
-                except subprocess.TimeoutExpired:
-                    proc.kill()
-                    captured_lines.append('{"type": "error", "message": "Execution timed out"}')
-
-            # Format trace for readability
-            formatted_trace = self._format_trace("\n".join(captured_lines))
-            trace_path.write_text(formatted_trace)
-
-            # Return 0 if we terminated early due to skill trigger (success)
-            if skill_triggered:
-                return 0
-            return proc.returncode or 0
-
-        except Exception as e:
-            trace_path.write_text(
-                f'{{\n  "type": "error",\n  "message": "Execution failed: {e}"\n}}\n'
-            )
-            return 1
-
-    def _check_skill_trigger(self, line: str, skill_name: str) -> bool:
+        command = [
+            codex_path,
+            "exec",
+            "--json",  # REQUIRED: emit structured events
+            "--full-auto",  # Allow file system changes
+            prompt,
+        ]
+        return self._run_and_capture(command, cwd, trace_path, stop_on_skill)
+
+    def _check_skill_trigger(self, line: bytes, skill_name: str) -> bool:
         """Check if a JSONL line indicates the skill was triggered.
 
         Looks for skill invocation events with the specified skill name.
         Codex may use different event formats than Claude.
 
         Args:
-            line: A single line of JSONL output.
+            line: A single line of JSONL output, as undecoded bytes.
             skill_name: The skill name to look for.
 
         Returns:
             True if the skill was triggered in this event.
         """
         try:
-            event = json.loads(line)
-        except json.JSONDecodeError:
+            event = json_loads(line)
+        except ValueError:
+            # Malformed JSON or invalid UTF-8 in the raw line
             return False
 
         # Check for skill_invocation item type (Codex format)
-        item = event.get("item", {})
+        item = event.get("item") or {}
         if item.get("type") == "skill_invocation" and skill_name in (item.get("command") or ""):
             return True
 
-        # Check for explicit $skill-name or skill:skill-name patterns
-        raw_str = str(event)
-        return f"${skill_name}" in raw_str or f"skill:{skill_name}" in raw_str
+        # Check for explicit $skill-name or skill:skill-name patterns in any
+        # string value, without formatting the whole event (outputs can be large)
+        dollar_ref = f"${skill_name}"
+        prefixed_ref = f"skill:{skill_name}"
+        return any(
+            dollar_ref in text or prefixed_ref in text for text in _iter_string_values(event)
+        )
 
     def parse_trace(self, trace_path: Path) -> Iterator[TraceEvent]:
         """Parse Codex trace into normalized TraceEvent objects."""
@@ -157,7 +128,8 @@ class CodexRuntime(RuntimeAdapter):
 
     def _normalize_event(self, raw: dict[str, Any]) -> TraceEvent:
         """Convert Codex event to normalized TraceEvent."""
-        item = raw.get("item", {})
+        # Most events (thread/turn status) carry no item; share one empty mapping
+        item = raw.get("item") or _NO_ITEM
 
         return TraceEvent(
             type=raw.get("type", "unknown"),
@@ -170,4 +142,4 @@ class CodexRuntime(RuntimeAdapter):
 
     def is_available(self) -> bool:
         """Check if Codex CLI is installed."""
-        return shutil.which("codex") is not None
+        return resolve_cli("codex") is not None
@@ -3,9 +3,8 @@
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from skill_lab.core.models import TraceCheckDefinition
+from skill_lab.core.utils import yaml_safe_load
 
 
 def load_trace_checks(skill_path: Path) -> list[TraceCheckDefinition]:
@@ -27,7 +26,7 @@ def load_trace_checks(skill_path: Path) -> list[TraceCheckDefinition]:
         raise FileNotFoundError(f"Trace checks file not found: {yaml_path}")
 
     with open(yaml_path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml_safe_load(f)
 
     if not data:
         raise ValueError(f"Empty trace checks file: {yaml_path}")
@@ -6,29 +6,46 @@ with ~13 tests across all 4 types (explicit, implicit, contextual, negative).
 
 from __future__ import annotations
 
+import functools
+import re
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
 from skill_lab.core.constants import TESTS_DIR
 from skill_lab.core.exceptions import GenerationError
+from skill_lab.core.utils import yaml_safe_dump, yaml_safe_load
 from skill_lab.parsers.skill_parser import parse_skill
 
+if TYPE_CHECKING:
+    import anthropic
+
 _SKILL_PROMPT_PATH = Path(__file__).parent / "generate_triggers_skill.md"
 
-SYSTEM_PROMPT = (
+SYSTEM_PROMPT_PREFIX = (
     "You are executing the generate-triggers skill. "
     "Follow the instructions below to generate trigger test cases for the target skill. "
     "Output ONLY valid YAML with no markdown fences, no explanations, no commentary.\n\n"
-    + _SKILL_PROMPT_PATH.read_text(encoding="utf-8")
 )
 
+
+@functools.cache
+def _system_prompt() -> str:
+    """Build the system prompt, reading the generate-triggers skill on first use."""
+    return SYSTEM_PROMPT_PREFIX + _SKILL_PROMPT_PATH.read_text(encoding="utf-8")
+
+
 DEFAULT_MODEL = "claude-haiku-4-5-20251001"
 MAX_BODY_CHARS = 4000
 
-VALID_TYPES = {"explicit", "implicit", "contextual", "negative"}
-VALID_EXPECTED = {"trigger", "no_trigger"}
+VALID_TYPES = frozenset({"explicit", "implicit", "contextual", "negative"})
+VALID_EXPECTED = frozenset({"trigger", "no_trigger"})
+REQUIRED_CASE_FIELDS = ("id", "type", "prompt", "expected")
+
+# First line of a usable response: a code fence, document marker, comment,
+# or top-level mapping key (keys are single words such as skill/test_cases)
+_YAML_HEAD_PATTERN = re.compile(r"```|---|#|[\w\"'-]+:(\s|$)")
 
 
 class GenerationUsage:
@@ -41,6 +58,12 @@ class GenerationUsage:
         "claude-opus-4-6": (15.00, 75.00),
     }
 
+    # Pricing per token (input, output), derived once from _PRICING
+    _PRICE_PER_TOKEN: dict[str, tuple[float, float]] = {
+        model: (input_price / 1_000_000, output_price / 1_000_000)
+        for model, (input_price, output_price) in _PRICING.items()
+    }
+
     def __init__(self, input_tokens: int, output_tokens: int, model: str) -> None:
         self.input_tokens = input_tokens
         self.output_tokens = output_tokens
@@ -53,27 +76,26 @@ class GenerationUsage:
     @property
     def input_cost(self) -> float | None:
         """Input cost in USD, or None if model pricing is unknown."""
-        pricing = self._PRICING.get(self.model)
+        pricing = self._PRICE_PER_TOKEN.get(self.model)
         if pricing is None:
             return None
-        return self.input_tokens * pricing[0] / 1_000_000
+        return self.input_tokens * pricing[0]
 
     @property
     def output_cost(self) -> float | None:
         """Output cost in USD, or None if model pricing is unknown."""
-        pricing = self._PRICING.get(self.model)
+        pricing = self._PRICE_PER_TOKEN.get(self.model)
         if pricing is None:
             return None
-        return self.output_tokens * pricing[1] / 1_000_000
+        return self.output_tokens * pricing[1]
 
     @property
     def total_cost(self) -> float | None:
         """Total cost in USD, or None if model pricing is unknown."""
-        input_c = self.input_cost
-        output_c = self.output_cost
-        if input_c is None or output_c is None:
+        pricing = self._PRICE_PER_TOKEN.get(self.model)
+        if pricing is None:
             return None
-        return input_c + output_c
+        return self.input_tokens * pricing[0] + self.output_tokens * pricing[1]
 
 
 class TriggerGenerator:
@@ -83,17 +105,25 @@ class TriggerGenerator:
         self,
         model: str = DEFAULT_MODEL,
         api_key: str | None = None,
+        client: anthropic.Anthropic | None = None,
     ) -> None:
         """Initialize the generator.
 
         Args:
             model: Anthropic model ID to use for generation.
             api_key: Anthropic API key. If None, uses ANTHROPIC_API_KEY env var.
+                Ignored when client is given.
+            client: Existing Anthropic client to use. Pass one client to every
+                generator in a batch so they share its connection pool instead
+                of each opening new connections.
         """
-        import anthropic  # lazy import — anthropic is optional
+        if client is None:
+            import anthropic  # lazy import — anthropic is optional
+
+            client = anthropic.Anthropic(api_key=api_key)
 
         self._model = model
-        self._client = anthropic.Anthropic(api_key=api_key)
+        self._client = client
         self.last_usage: GenerationUsage | None = None
 
     def generate(self, skill_path: Path) -> str:
@@ -123,7 +153,7 @@ class TriggerGenerator:
         response_text = self._call_api(prompt)
         data = self._parse_response(response_text, skill_name)
 
-        return yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        return yaml_safe_dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
     def generate_and_write(self, skill_path: Path, *, force: bool = False) -> Path:
         """Generate trigger tests and write to .skill-lab/tests/triggers.yaml.
@@ -179,6 +209,10 @@ class TriggerGenerator:
     def _call_api(self, prompt: str) -> str:
         """Call the Anthropic API to generate test cases.
 
+        The response is streamed so that output which is clearly not YAML
+        (e.g., a prose preamble) aborts the request after its first line,
+        instead of paying for the remaining output tokens.
+
         Args:
             prompt: The user message to send.
 
@@ -186,15 +220,29 @@ class TriggerGenerator:
             The model's response text.
 
         Raises:
-            GenerationError: If the API call fails.
+            GenerationError: If the API call fails or the response is not YAML.
         """
         try:
-            message = self._client.messages.create(
+            with self._client.messages.stream(
                 model=self._model,
                 max_tokens=2048,
-                system=SYSTEM_PROMPT,
+                system=_system_prompt(),
                 messages=[{"role": "user", "content": prompt}],
-            )
+            ) as stream:
+                head = ""
+                for text in stream.text_stream:
+                    head += text
+                    first_line, newline, _ = head.lstrip().partition("\n")
+                    if newline:
+                        if not _YAML_HEAD_PATTERN.match(first_line):
+                            raise GenerationError(
+                                f"Model response is not YAML: {first_line[:80]!r}",
+                                suggestion="The model returned unexpected format. Try running again.",
+                            )
+                        break
+                # Consume the rest of the response once the head is validated
+                message = stream.get_final_message()
+
             # Capture token usage
             self.last_usage = GenerationUsage(
                 input_tokens=message.usage.input_tokens,
@@ -233,16 +281,16 @@ class TriggerGenerator:
         # Strip markdown code fences if present
         text = response_text.strip()
         if text.startswith("```"):
-            lines = text.split("\n")
             # Remove first line (```yaml or ```)
-            lines = lines[1:]
+            first_nl = text.find("\n")
+            text = text[first_nl + 1 :] if first_nl != -1 else ""
             # Remove last line if it's closing fence
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            text = "\n".join(lines)
+            last_nl = text.rfind("\n")
+            if text[last_nl + 1 :].strip() == "```":
+                text = text[:last_nl] if last_nl != -1 else ""
 
         try:
-            data = yaml.safe_load(text)
+            data = yaml_safe_load(text)
         except yaml.YAMLError as e:
             raise GenerationError(
                 f"Failed to parse generated YAML: {e}",
@@ -288,18 +336,18 @@ class TriggerGenerator:
             if not isinstance(case, dict):
                 raise GenerationError(f"Test case {i + 1} is not a mapping")
 
-            for required in ("id", "type", "prompt", "expected"):
+            for required in REQUIRED_CASE_FIELDS:
                 if required not in case:
                     raise GenerationError(f"Test case {i + 1} missing required field '{required}'")
 
-            case_type = case.get("type")
+            case_type = case["type"]
             if case_type not in VALID_TYPES:
                 raise GenerationError(
                     f"Test case {i + 1} has invalid type '{case_type}', "
                     f"expected one of: {', '.join(sorted(VALID_TYPES))}"
                 )
 
-            expected = case.get("expected")
+            expected = case["expected"]
             if expected not in VALID_EXPECTED:
                 raise GenerationError(
                     f"Test case {i + 1} has invalid expected '{expected}', "
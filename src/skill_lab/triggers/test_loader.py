@@ -12,6 +12,7 @@ import yaml
 
 from skill_lab.core.constants import TESTS_DIR
 from skill_lab.core.models import TriggerExpectation, TriggerTestCase, TriggerType
+from skill_lab.core.utils import yaml_safe_load
 
 
 def load_trigger_tests(skill_path: Path) -> tuple[list[TriggerTestCase], list[str]]:
@@ -77,7 +78,7 @@ def _load_scenarios_yaml(path: Path) -> tuple[list[TriggerTestCase], list[str]]:
     errors: list[str] = []
 
     try:
-        content = yaml.safe_load(path.read_text())
+        content = yaml_safe_load(path.read_text())
     except yaml.YAMLError as e:
         return [], [f"Failed to parse {path.name}: {e}"]
 
@@ -174,7 +175,7 @@ def _load_triggers_yaml(path: Path) -> tuple[list[TriggerTestCase], list[str]]:
     errors: list[str] = []
 
     try:
-        content = yaml.safe_load(path.read_text())
+        content = yaml_safe_load(path.read_text())
     except yaml.YAMLError as e:
         return [], [f"Failed to parse {path.name}: {e}"]
 
@@ -1,6 +1,7 @@
 """Analyze execution traces for skill invocations and command patterns."""
 
 from collections import Counter
+from functools import cached_property
 from pathlib import Path
 
 from skill_lab.core.constants import skill_script_patterns
@@ -20,6 +21,9 @@ class TraceAnalyzer:
     def __init__(self, events: list[TraceEvent]) -> None:
         """Initialize with a list of trace events.
 
+        Command lookups are computed on first use and cached, so events
+        should not be modified after construction.
+
         Args:
             events: List of normalized TraceEvent objects.
         """
@@ -120,11 +124,19 @@ class TraceAnalyzer:
         Returns:
             True if a matching command was found.
         """
-        return any(
-            event.command and pattern in event.command
-            for event in self.events
-            if event.type in ("item.started", "item.completed")
-            and event.item_type == "command_execution"
+        return any(pattern in command for command in self._executed_commands)
+
+    @cached_property
+    def _executed_commands(self) -> tuple[str, ...]:
+        """Distinct commands from started or completed command executions."""
+        return tuple(
+            dict.fromkeys(
+                event.command
+                for event in self.events
+                if event.type in ("item.started", "item.completed")
+                and event.item_type == "command_execution"
+                and event.command
+            )
         )
 
     def file_was_created(self, filepath: str, project_dir: Path) -> bool:
@@ -164,9 +176,12 @@ class TraceAnalyzer:
         Returns:
             True if excessive repetition was detected.
         """
-        commands = self.get_command_sequence()
-        counts = Counter(commands)
-        return any(count > max_repeats for count in counts.values())
+        return any(count > max_repeats for count in self._command_counts.values())
+
+    @cached_property
+    def _command_counts(self) -> Counter[str]:
+        """How many times each completed command was run."""
+        return Counter(self.get_command_sequence())
 
     def get_all_commands_matching(self, patterns: list[str]) -> list[str]:
         """Get all commands that match any of the given patterns.
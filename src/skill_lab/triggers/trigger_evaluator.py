@@ -1,18 +1,23 @@
 """Orchestrate trigger test execution."""
 
+import functools
+import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
 from skill_lab.core.constants import TRACES_DIR
 from skill_lab.core.models import (
+    TraceEvent,
     TriggerReport,
     TriggerResult,
     TriggerTestCase,
     TriggerType,
 )
 from skill_lab.core.scoring import build_summary_by_attribute, calculate_metrics
+from skill_lab.core.utils import available_cpus
 from skill_lab.runtimes.base import RuntimeAdapter
 from skill_lab.runtimes.claude_runtime import ClaudeRuntime
 from skill_lab.runtimes.codex_runtime import CodexRuntime
@@ -20,6 +25,51 @@ from skill_lab.triggers.test_loader import load_trigger_tests
 from skill_lab.triggers.trace_analyzer import TraceAnalyzer
 
 
+@functools.lru_cache(maxsize=256)
+def _find_project_root(resolved_skill_path: str) -> Path | None:
+    """Find the project root directory containing .claude/skills/.
+
+    Traverses up from skill_path to find a directory that contains
+    .claude/skills/. This is used to run implicit tests from a location
+    where Claude can discover project-level skills.
+
+    Results are cached per resolved path, since repeated evaluations of
+    the same skill would otherwise repeat the directory walk; call
+    clear_caches() if the directory layout changes.
+
+    Args:
+        resolved_skill_path: Resolved path to the skill directory.
+
+    Returns:
+        Path to project root, or None if not found.
+    """
+    # skill_path is typically: /project/.claude/skills/skill-name
+    # We want to find: /project (which contains .claude/skills/)
+    current = Path(resolved_skill_path)
+
+    # Traverse up to find .claude/skills/
+    for _ in range(10):  # Limit depth to avoid infinite loop
+        # Check if this directory contains .claude/skills/
+        if (current / ".claude" / "skills").is_dir():
+            return current
+
+        # Check if we're inside .claude/skills/ already
+        if current.name == "skills" and current.parent.name == ".claude":
+            return current.parent.parent
+
+        parent = current.parent
+        if parent == current:  # Reached root
+            break
+        current = parent
+
+    return None
+
+
+def clear_caches() -> None:
+    """Clear cached filesystem lookups. Useful for testing."""
+    _find_project_root.cache_clear()
+
+
 class TriggerEvaluator:
     """Orchestrate trigger testing for skills.
 
@@ -33,47 +83,20 @@ class TriggerEvaluator:
     def __init__(
         self,
         runtime: str | None = None,
+        concurrency: int | None = None,
     ) -> None:
         """Initialize the trigger evaluator.
 
         Args:
             runtime: Runtime to use ('codex', 'claude', or None for auto-detect).
+            concurrency: Maximum number of tests to run at once. Defaults to
+                the available CPUs minus two (at least 1). Tests share one
+                working directory, so those expecting files_created always
+                run alone.
         """
         self._runtime_name = runtime
-
-    def _find_project_root(self, skill_path: Path) -> Path | None:
-        """Find the project root directory containing .claude/skills/.
-
-        Traverses up from skill_path to find a directory that contains
-        .claude/skills/. This is used to run implicit tests from a location
-        where Claude can discover project-level skills.
-
-        Args:
-            skill_path: Path to the skill directory.
-
-        Returns:
-            Path to project root, or None if not found.
-        """
-        # skill_path is typically: /project/.claude/skills/skill-name
-        # We want to find: /project (which contains .claude/skills/)
-        current = skill_path.resolve()
-
-        # Traverse up to find .claude/skills/
-        for _ in range(10):  # Limit depth to avoid infinite loop
-            # Check if this directory contains .claude/skills/
-            if (current / ".claude" / "skills").is_dir():
-                return current
-
-            # Check if we're inside .claude/skills/ already
-            if current.name == "skills" and current.parent.name == ".claude":
-                return current.parent.parent
-
-            parent = current.parent
-            if parent == current:  # Reached root
-                break
-            current = parent
-
-        return None
+        self._runtime: RuntimeAdapter | None = None
+        self._concurrency = concurrency or max(1, available_cpus() - 2)
 
     def evaluate(
         self,
@@ -91,15 +114,13 @@ class TriggerEvaluator:
         Returns:
             TriggerReport with all test results.
         """
-        start_time = time.time()
-        skill_path = Path(skill_path)
+        start_time = time.perf_counter()
+        # Resolved once; the project root lookup and every test reuse it
+        skill_path = Path(skill_path).resolve()
 
         # Store traces in the skill's .skill-lab/traces directory
         self._trace_dir = skill_path / TRACES_DIR
 
-        # Find project root for implicit tests (where .claude/skills/ is visible)
-        project_root = self._find_project_root(skill_path)
-
         # Load test cases
         test_cases, load_errors = load_trigger_tests(skill_path)
 
@@ -107,6 +128,27 @@ class TriggerEvaluator:
         if type_filter:
             test_cases = [tc for tc in test_cases if tc.trigger_type == type_filter]
 
+        # Nothing to run: skip the project root lookup, runtime detection
+        # and test dispatch
+        if not test_cases and not load_errors:
+            return TriggerReport(
+                skill_path=str(skill_path),
+                skill_name=skill_path.name,
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                duration_ms=(time.perf_counter() - start_time) * 1000,
+                runtime=self._runtime.name if self._runtime else (self._runtime_name or "auto"),
+                tests_run=0,
+                tests_passed=0,
+                tests_failed=0,
+                overall_pass=True,
+                pass_rate=0.0,
+                results=[],
+                summary_by_type={},
+            )
+
+        # Find project root for implicit tests (where .claude/skills/ is visible)
+        project_root = _find_project_root(str(skill_path))
+
         # Get runtime adapter
         runtime = self._get_runtime()
 
@@ -131,15 +173,14 @@ class TriggerEvaluator:
                     )
                 )
         else:
-            total = len(test_cases)
-            for i, test_case in enumerate(test_cases):
-                if progress_callback:
-                    progress_callback(i + 1, total, test_case.name)
-                result = self._run_single_test(test_case, skill_path, runtime, project_root)
-                results.append(result)
+            # Created once here; every test writes its trace into this directory
+            self._trace_dir.mkdir(parents=True, exist_ok=True)
+            results = self._run_tests(
+                test_cases, skill_path, runtime, project_root, progress_callback
+            )
 
         # Calculate metrics
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
         metrics = calculate_metrics(results)
 
         # Build summary by trigger type
@@ -160,8 +201,82 @@ class TriggerEvaluator:
             summary_by_type=summary_by_type,
         )
 
+    def _run_tests(
+        self,
+        test_cases: list[TriggerTestCase],
+        skill_path: Path,
+        runtime: RuntimeAdapter,
+        project_root: Path | None,
+        progress_callback: Callable[[int, int, str], None] | None,
+    ) -> list[TriggerResult]:
+        """Run test cases on a thread pool, up to the configured concurrency.
+
+        Each test blocks on its own runtime subprocess and writes its own
+        trace file, but every agent runs in the same working directory.
+        Tests that expect files_created check the filesystem afterwards, so
+        another agent's edits could change their outcome; they run one at a
+        time after the concurrent tests have finished.
+
+        Args:
+            test_cases: Test cases to run.
+            skill_path: Path to the skill directory.
+            runtime: Runtime adapter to use.
+            project_root: Project root directory (where .claude/skills/ exists).
+            progress_callback: Optional callback(current, total, test_name),
+                called as each test starts.
+
+        Returns:
+            Results in the same order as test_cases.
+        """
+        total = len(test_cases)
+        results: list[TriggerResult | None] = [None] * total
+        progress_lock = threading.Lock()
+        abort = threading.Event()
+        started = 0
+
+        def run(test_case: TriggerTestCase) -> TriggerResult | None:
+            nonlocal started
+            if abort.is_set():
+                return None
+            if progress_callback:
+                with progress_lock:
+                    started += 1
+                    progress_callback(started, total, test_case.name)
+            return self._run_single_test(test_case, skill_path, runtime, project_root)
+
+        concurrent = [i for i, tc in enumerate(test_cases) if not tc.expected.files_created]
+        isolated = [i for i, tc in enumerate(test_cases) if tc.expected.files_created]
+
+        if concurrent:
+            pool = ThreadPoolExecutor(max_workers=min(self._concurrency, len(concurrent)))
+            try:
+                futures = {pool.submit(run, test_cases[i]): i for i in concurrent}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+            except BaseException:
+                # e.g. KeyboardInterrupt: don't start queued tests
+                abort.set()
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            pool.shutdown()
+
+        for i in isolated:
+            results[i] = run(test_cases[i])
+
+        return [result for result in results if result is not None]
+
     def _get_runtime(self) -> RuntimeAdapter:
-        """Get the runtime adapter to use."""
+        """Get the runtime adapter to use.
+
+        The adapter is resolved on first use and reused by later evaluate()
+        calls on this evaluator.
+        """
+        if self._runtime is None:
+            self._runtime = self._resolve_runtime()
+        return self._runtime
+
+    def _resolve_runtime(self) -> RuntimeAdapter:
+        """Create the runtime adapter selected at construction."""
         if self._runtime_name == "codex":
             return CodexRuntime()
         elif self._runtime_name == "claude":
@@ -205,7 +320,6 @@ class TriggerEvaluator:
         """
         # Determine trace path
         trace_path = self._trace_dir / f"{test_case.id}.jsonl"
-        trace_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Always run from project root to ensure all skills are loaded
         # This provides a consistent testing environment where Claude can
@@ -228,8 +342,15 @@ class TriggerEvaluator:
                 working_dir=working_dir,
             )
 
-            # Parse and analyze the trace
-            events = list(runtime.parse_trace(trace_path))
+            # Parse and analyze the trace in one streaming pass. System init
+            # events (tool and skill listings, often the largest events) are
+            # counted but not retained: no trigger check inspects them.
+            events_count = 0
+            events: list[TraceEvent] = []
+            for event in runtime.parse_trace(trace_path):
+                events_count += 1
+                if event.raw.get("type") != "system":
+                    events.append(event)
             analyzer = TraceAnalyzer(events)
 
             # Check if skill was triggered
@@ -257,7 +378,7 @@ class TriggerEvaluator:
                 expected_trigger=test_case.expected.skill_triggered,
                 message=message,
                 trace_path=trace_path,
-                events_count=len(events),
+                events_count=events_count,
                 exit_code=exit_code,
             )
 
@@ -304,15 +425,16 @@ class TriggerEvaluator:
         if expected.exit_code is not None and exit_code != expected.exit_code:
             return False
 
+        # Remaining checks run cheapest first: loop detection and command
+        # lookups stay in memory, file checks stat the filesystem
+        if expected.no_loops and analyzer.detect_loops():
+            return False
+
         # Check required commands
-        for cmd in expected.commands_include:
-            if not analyzer.command_was_run(cmd):
-                return False
+        if not all(analyzer.command_was_run(cmd) for cmd in expected.commands_include):
+            return False
 
         # Check file creation
-        for filepath in expected.files_created:
-            if not analyzer.file_was_created(filepath, skill_path):
-                return False
-
-        # Check for loops
-        return not (expected.no_loops and analyzer.detect_loops())
+        return all(
+            analyzer.file_was_created(filepath, skill_path) for filepath in expected.files_created
+        )
@@ -4,53 +4,67 @@ from pathlib import Path
 
 import pytest
 
+from skill_lab.core.models import EvaluationReport, Skill
 from skill_lab.evaluators.static_evaluator import StaticEvaluator
 from skill_lab.evaluators.trace_evaluator import TraceEvaluator
+from skill_lab.parsers.skill_parser import parse_skill
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Get the path to the fixtures directory."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def skills_dir(fixtures_dir: Path) -> Path:
     """Get the path to the skills fixtures directory."""
     return fixtures_dir / "skills"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_skill_path(skills_dir: Path) -> Path:
     """Get the path to a valid skill fixture."""
     return skills_dir / "creating-reports"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_skill_path(skills_dir: Path) -> Path:
     """Get the path to an invalid skill fixture."""
     return skills_dir / "invalid-skill"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_skill_path(skills_dir: Path) -> Path:
     """Get the path to a minimal valid skill fixture."""
     return skills_dir / "testing-features"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def evaluator() -> StaticEvaluator:
     """Get a StaticEvaluator instance."""
     return StaticEvaluator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def valid_skill(valid_skill_path: Path) -> Skill:
+    """Get the valid skill fixture, parsed once per session."""
+    return parse_skill(valid_skill_path)
+
+
+@pytest.fixture(scope="session")
+def valid_skill_report(evaluator: StaticEvaluator, valid_skill_path: Path) -> EvaluationReport:
+    """Get the static evaluation report for the valid skill fixture."""
+    return evaluator.evaluate(valid_skill_path)
+
+
+@pytest.fixture(scope="session")
 def traces_dir(fixtures_dir: Path) -> Path:
     """Get the path to the traces fixtures directory."""
     return fixtures_dir / "traces"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_trace_path(traces_dir: Path) -> Path:
     """Get the path to the sample trace file."""
     return traces_dir / "sample_trace.jsonl"
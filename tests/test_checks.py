@@ -1,6 +1,9 @@
 """Tests for static checks."""
 
+import functools
+from dataclasses import replace
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -24,8 +27,9 @@ from skill_lab.core.registry import registry
 from skill_lab.checks.static import schema as _schema  # noqa: F401
 
 
+@functools.cache
 def _get_check(check_id: str):
-    """Get a check instance from the registry by ID."""
+    """Get a check instance from the registry by ID (one shared, stateless instance per ID)."""
     check_class = registry.get(check_id)
     assert check_class is not None, f"Check '{check_id}' not found in registry"
     return check_class()
@@ -50,6 +54,36 @@ def make_skill(
     )
 
 
+# Oversized payloads for the max-length and line-budget failure tests
+_LONG_DESCRIPTION = "x" * 2000
+_MANY_LINES = "\n".join(["Line"] * 600)
+
+# Frontmatter shared by every frontmatter check case; cases add their field on top
+_BASE_RAW = MappingProxyType({"name": "my-skill", "description": "A test skill"})
+
+
+def make_frontmatter_skill(extra_raw: dict) -> Skill:
+    """Helper to create a Skill whose frontmatter has the given extra fields."""
+    return Skill(
+        path=Path("/test/my-skill"),
+        metadata=SkillMetadata(
+            name=_BASE_RAW["name"],
+            description=_BASE_RAW["description"],
+            raw={**_BASE_RAW, **extra_raw},
+        ),
+        body="Body content",
+        has_scripts=False,
+        has_references=False,
+        has_assets=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def base_skill() -> Skill:
+    """Default skill, built once per module; Skill is frozen, so derive variants with replace()."""
+    return make_skill()
+
+
 class TestStructureChecks:
     """Tests for structure checks."""
 
@@ -66,9 +100,9 @@ class TestStructureChecks:
         result = check.run(skill)
         assert result.passed
 
-    def test_valid_frontmatter_pass(self):
+    def test_valid_frontmatter_pass(self, base_skill):
         check = ValidFrontmatterCheck()
-        skill = make_skill()
+        skill = base_skill
         result = check.run(skill)
         assert result.passed
 
@@ -169,21 +203,29 @@ class TestNamingChecks:
         result = check.run(skill)
         assert not result.passed
 
-    def test_name_format_valid(self):
-        check = _get_check("naming.format")
-        # Per spec: lowercase alphanumeric + hyphens, no start/end hyphen
-        for valid_name in ["my-skill", "skill123", "a", "creating-reports", "30daysresearch", "123", "1"]:
-            skill = make_skill(name=valid_name)
-            result = check.run(skill)
-            assert result.passed, f"Expected '{valid_name}' to pass"
-
-    def test_name_format_invalid(self):
-        check = _get_check("naming.format")
-        # Invalid: uppercase, underscores, spaces, start/end with hyphen, consecutive hyphens
-        for invalid_name in ["My_Skill", "UPPERCASE", "spaces here", "-starts-with-hyphen", "ends-with-hyphen-", "has--consecutive-hyphens"]:
-            skill = make_skill(name=invalid_name)
-            result = check.run(skill)
-            assert not result.passed, f"Expected '{invalid_name}' to fail"
+    # Per spec: lowercase alphanumeric + hyphens, no start/end hyphen
+    @pytest.mark.parametrize(
+        "name", ["my-skill", "skill123", "a", "creating-reports", "30daysresearch", "123", "1"]
+    )
+    def test_name_format_valid(self, name):
+        result = _get_check("naming.format").run(make_skill(name=name))
+        assert result.passed
+
+    # Invalid: uppercase, underscores, spaces, start/end with hyphen, consecutive hyphens
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "My_Skill",
+            "UPPERCASE",
+            "spaces here",
+            "-starts-with-hyphen",
+            "ends-with-hyphen-",
+            "has--consecutive-hyphens",
+        ],
+    )
+    def test_name_format_invalid(self, name):
+        result = _get_check("naming.format").run(make_skill(name=name))
+        assert not result.passed
 
     def test_name_matches_directory_pass(self):
         check = NameMatchesDirectoryCheck()
@@ -228,7 +270,7 @@ class TestDescriptionChecks:
 
     def test_description_max_length_fail(self):
         check = _get_check("description.max-length")
-        skill = make_skill(description="x" * 2000)
+        skill = make_skill(description=_LONG_DESCRIPTION)
         result = check.run(skill)
         assert not result.passed
 
@@ -237,274 +279,145 @@ class TestDescriptionChecks:
 class TestContentChecks:
     """Tests for content checks."""
 
-    def test_body_not_empty_pass(self):
+    def test_body_not_empty_pass(self, base_skill):
         check = BodyNotEmptyCheck()
-        skill = make_skill(body="This is some meaningful content that is long enough to pass the minimum requirement.")
+        skill = replace(
+            base_skill,
+            body=(
+                "This is some meaningful content that is long enough "
+                "to pass the minimum requirement."
+            ),
+        )
         result = check.run(skill)
         assert result.passed
 
-    def test_body_not_empty_fail(self):
+    def test_body_not_empty_fail(self, base_skill):
         check = BodyNotEmptyCheck()
-        skill = make_skill(body="")
+        skill = replace(base_skill, body="")
         result = check.run(skill)
         assert not result.passed
         assert result.severity == Severity.WARNING  # Quality suggestion, spec allows empty body
 
-    def test_body_too_short(self):
+    def test_body_too_short(self, base_skill):
         check = BodyNotEmptyCheck()
-        skill = make_skill(body="Short")
+        skill = replace(base_skill, body="Short")
         result = check.run(skill)
         assert not result.passed
 
-    def test_line_budget_pass(self):
+    def test_line_budget_pass(self, base_skill):
         check = LineBudgetCheck()
-        skill = make_skill(body="Line 1\nLine 2\nLine 3")
+        skill = replace(base_skill, body="Line 1\nLine 2\nLine 3")
         result = check.run(skill)
         assert result.passed
 
-    def test_line_budget_fail(self):
+    def test_line_budget_fail(self, base_skill):
         check = LineBudgetCheck()
-        skill = make_skill(body="\n".join(["Line"] * 600))
+        skill = replace(base_skill, body=_MANY_LINES)
         result = check.run(skill)
         assert not result.passed
 
-    def test_has_examples_pass(self):
+    def test_has_examples_pass(self, base_skill):
         check = HasExamplesCheck()
-        skill = make_skill(body="# Title\n\n```python\ncode here\n```")
+        skill = replace(base_skill, body="# Title\n\n```python\ncode here\n```")
         result = check.run(skill)
         assert result.passed
 
-    def test_has_examples_fail(self):
+    @pytest.mark.parametrize(
+        "body",
+        ["Usage:\n\n    run-tool --flag", "<example>\nrun it\n</example>"],
+        ids=["indented", "tagged"],
+    )
+    def test_has_examples_indented_and_tagged(self, base_skill, body):
         check = HasExamplesCheck()
-        skill = make_skill(body="Just text without any code examples.")
-        result = check.run(skill)
-        assert not result.passed
-
-
-class TestFrontmatterChecks:
-    """Tests for optional frontmatter field checks."""
-
-    def test_compatibility_valid(self):
-        check = _get_check("frontmatter.compatibility-length")
-        skill = Skill(
-            path=Path("/test/my-skill"),
-            metadata=SkillMetadata(
-                name="my-skill",
-                description="A test skill",
-                raw={
-                    "name": "my-skill",
-                    "description": "A test skill",
-                    "compatibility": "Requires Python 3.10+",
-                },
-            ),
-            body="Body content",
-            has_scripts=False,
-            has_references=False,
-            has_assets=False,
-        )
-        result = check.run(skill)
+        result = check.run(replace(base_skill, body=body))
         assert result.passed
 
-    def test_compatibility_too_long(self):
-        check = _get_check("frontmatter.compatibility-length")
-        skill = Skill(
-            path=Path("/test/my-skill"),
-            metadata=SkillMetadata(
-                name="my-skill",
-                description="A test skill",
-                raw={
-                    "name": "my-skill",
-                    "description": "A test skill",
-                    "compatibility": "x" * 501,  # Over 500 chars
-                },
-            ),
-            body="Body content",
-            has_scripts=False,
-            has_references=False,
-            has_assets=False,
-        )
-        result = check.run(skill)
-        assert not result.passed
-        assert "exceeds" in result.message
-
-    def test_compatibility_empty_fails(self):
-        """Spec requires 1-500 characters if provided."""
-        check = _get_check("frontmatter.compatibility-length")
-        skill = Skill(
-            path=Path("/test/my-skill"),
-            metadata=SkillMetadata(
-                name="my-skill",
-                description="A test skill",
-                raw={
-                    "name": "my-skill",
-                    "description": "A test skill",
-                    "compatibility": "",  # Empty string
-                },
-            ),
-            body="Body content",
-            has_scripts=False,
-            has_references=False,
-            has_assets=False,
-        )
-        result = check.run(skill)
-        assert not result.passed
-        assert "empty" in result.message.lower()
-
-    def test_compatibility_whitespace_only_fails(self):
-        """Whitespace-only compatibility should fail."""
-        check = _get_check("frontmatter.compatibility-length")
-        skill = Skill(
-            path=Path("/test/my-skill"),
-            metadata=SkillMetadata(
-                name="my-skill",
-                description="A test skill",
-                raw={
-                    "name": "my-skill",
-                    "description": "A test skill",
-                    "compatibility": "   ",  # Whitespace only
-                },
-            ),
-            body="Body content",
-            has_scripts=False,
-            has_references=False,
-            has_assets=False,
-        )
-        result = check.run(skill)
-        assert not result.passed
-
-    def test_metadata_valid(self):
-        check = _get_check("frontmatter.metadata-format")
-        skill = Skill(
-            path=Path("/test/my-skill"),
-            metadata=SkillMetadata(
-                name="my-skill",
-                description="A test skill",
-                raw={
-                    "name": "my-skill",
-                    "description": "A test skill",
-                    "metadata": {"author": "test-org", "version": "1.0"},
-                },
-            ),
-            body="Body content",
-            has_scripts=False,
-            has_references=False,
-            has_assets=False,
-        )
-        result = check.run(skill)
-        assert result.passed
-
-    def test_metadata_non_string_value_fails(self):
-        check = _get_check("frontmatter.metadata-format")
-        skill = Skill(
-            path=Path("/test/my-skill"),
-            metadata=SkillMetadata(
-                name="my-skill",
-                description="A test skill",
-                raw={
-                    "name": "my-skill",
-                    "description": "A test skill",
-                    "metadata": {"author": "test-org", "version": 1.0},  # Number instead of string
-                },
-            ),
-            body="Body content",
-            has_scripts=False,
-            has_references=False,
-            has_assets=False,
-        )
+    def test_has_examples_fail(self, base_skill):
+        check = HasExamplesCheck()
+        skill = replace(base_skill, body="Just text without any code examples.")
         result = check.run(skill)
         assert not result.passed
-        assert "string" in result.message.lower()
 
-    def test_allowed_tools_valid(self):
-        check = _get_check("frontmatter.allowed-tools-format")
-        skill = Skill(
-            path=Path("/test/my-skill"),
-            metadata=SkillMetadata(
-                name="my-skill",
-                description="A test skill",
-                raw={
-                    "name": "my-skill",
-                    "description": "A test skill",
-                    "allowed-tools": "Read Write Bash",
-                },
-            ),
-            body="Body content",
-            has_scripts=False,
-            has_references=False,
-            has_assets=False,
-        )
-        result = check.run(skill)
-        assert result.passed
 
-    def test_allowed_tools_list_fails(self):
-        """Using YAML list syntax instead of space-delimited string should fail."""
-        check = _get_check("frontmatter.allowed-tools-format")
-        skill = Skill(
-            path=Path("/test/my-skill"),
-            metadata=SkillMetadata(
-                name="my-skill",
-                description="A test skill",
-                raw={
-                    "name": "my-skill",
-                    "description": "A test skill",
-                    "allowed-tools": ["Read", "Write", "Bash"],  # List instead of string
-                },
-            ),
-            body="Body content",
-            has_scripts=False,
-            has_references=False,
-            has_assets=False,
-        )
-        result = check.run(skill)
-        assert not result.passed
-        assert "space-delimited" in result.message.lower()
+# (check_id, test ID label, extra frontmatter fields, expected pass, expected message fragment)
+FRONTMATTER_CASES = [
+    (
+        "frontmatter.compatibility-length",
+        "valid",
+        {"compatibility": "Requires Python 3.10+"},
+        True,
+        None,
+    ),
+    # Over 500 chars
+    (
+        "frontmatter.compatibility-length",
+        "too-long",
+        {"compatibility": "x" * 501},
+        False,
+        "exceeds",
+    ),
+    # Spec requires 1-500 characters if provided
+    ("frontmatter.compatibility-length", "empty", {"compatibility": ""}, False, "empty"),
+    ("frontmatter.compatibility-length", "whitespace", {"compatibility": "   "}, False, None),
+    (
+        "frontmatter.metadata-format",
+        "string-values",
+        {"metadata": {"author": "test-org", "version": "1.0"}},
+        True,
+        None,
+    ),
+    # Number instead of string
+    (
+        "frontmatter.metadata-format",
+        "number-value",
+        {"metadata": {"author": "test-org", "version": 1.0}},
+        False,
+        "string",
+    ),
+    (
+        "frontmatter.allowed-tools-format",
+        "space-delimited",
+        {"allowed-tools": "Read Write Bash"},
+        True,
+        None,
+    ),
+    # YAML list syntax instead of a space-delimited string
+    (
+        "frontmatter.allowed-tools-format",
+        "yaml-list",
+        {"allowed-tools": ["Read", "Write", "Bash"]},
+        False,
+        "space-delimited",
+    ),
+    ("frontmatter.license-format", "spdx", {"license": "Apache-2.0"}, True, None),
+    ("frontmatter.license-format", "omitted", {}, True, None),
+    # YAML can parse 'license: true' as boolean
+    ("frontmatter.license-format", "boolean", {"license": True}, False, "string"),
+]
+
+
+def _frontmatter_case_id(case) -> str:
+    """Readable test ID for a FRONTMATTER_CASES entry, e.g. 'license-format-boolean'."""
+    check_id, label, *_ = case
+    return f"{check_id.removeprefix('frontmatter.')}-{label}"
+
+
+@pytest.fixture
+def skill_case(request):
+    """Build the check and skill for a FRONTMATTER_CASES entry."""
+    check_id, _, extra_raw, expect_pass, message_part = request.param
+    return _get_check(check_id), make_frontmatter_skill(extra_raw), expect_pass, message_part
 
-    def test_license_valid_string(self):
-        check = _get_check("frontmatter.license-format")
-        skill = Skill(
-            path=Path("/test/my-skill"),
-            metadata=SkillMetadata(
-                name="my-skill",
-                description="A test skill",
-                raw={
-                    "name": "my-skill",
-                    "description": "A test skill",
-                    "license": "Apache-2.0",
-                },
-            ),
-            body="Body content",
-            has_scripts=False,
-            has_references=False,
-            has_assets=False,
-        )
-        result = check.run(skill)
-        assert result.passed
 
-    def test_license_absent_passes(self):
-        check = _get_check("frontmatter.license-format")
-        skill = make_skill()
-        result = check.run(skill)
-        assert result.passed
+class TestFrontmatterChecks:
+    """Tests for optional frontmatter field checks."""
 
-    def test_license_non_string_fails(self):
-        """YAML can parse 'license: true' as boolean."""
-        check = _get_check("frontmatter.license-format")
-        skill = Skill(
-            path=Path("/test/my-skill"),
-            metadata=SkillMetadata(
-                name="my-skill",
-                description="A test skill",
-                raw={
-                    "name": "my-skill",
-                    "description": "A test skill",
-                    "license": True,  # Boolean instead of string
-                },
-            ),
-            body="Body content",
-            has_scripts=False,
-            has_references=False,
-            has_assets=False,
-        )
+    @pytest.mark.parametrize(
+        "skill_case", FRONTMATTER_CASES, indirect=True, ids=_frontmatter_case_id
+    )
+    def test_frontmatter_field(self, skill_case):
+        check, skill, expect_pass, message_part = skill_case
         result = check.run(skill)
-        assert not result.passed
-        assert "string" in result.message.lower()
+        assert result.passed is expect_pass
+        if message_part:
+            assert message_part in result.message.lower()
@@ -91,3 +91,22 @@ class TestTriggerCommand:
         assert result.exit_code == 1
         assert "No trigger tests found" in result.stdout
         assert "sklab generate" in result.stdout
+
+
+class TestFormatTraceCommand:
+    """Tests for the format-trace command."""
+
+    def test_format_trace_prints_pretty_json(self, tmp_path: Path):
+        trace = tmp_path / "trace.jsonl"
+        trace.write_text('{"type":"result","result":"ok"}\n')
+        result = runner.invoke(app, ["format-trace", str(trace)])
+        assert result.exit_code == 0
+        assert '  "type": "result"' in result.stdout
+
+    def test_format_trace_writes_output_file(self, tmp_path: Path):
+        trace = tmp_path / "trace.jsonl"
+        trace.write_text('{"type":"result"}\n')
+        output = tmp_path / "formatted.json"
+        result = runner.invoke(app, ["format-trace", str(trace), "-o", str(output)])
+        assert result.exit_code == 0
+        assert output.read_text() == '{\n  "type": "result"\n}\n'
@@ -2,21 +2,33 @@
 
 from pathlib import Path
 
+import pytest
+
+from skill_lab.core.models import EvaluationReport, Skill
 from skill_lab.evaluators.static_evaluator import StaticEvaluator
 
 
 class TestStaticEvaluator:
     """Tests for StaticEvaluator class."""
 
-    def test_evaluate_valid_skill(self, evaluator: StaticEvaluator, valid_skill_path: Path):
-        report = evaluator.evaluate(valid_skill_path)
-
-        assert Path(report.skill_path) == valid_skill_path
-        assert report.skill_name == "creating-reports"
-        assert report.checks_run > 0
-        assert report.quality_score > 0
-        assert report.timestamp
-        assert report.duration_ms >= 0
+    def test_evaluate_valid_skill_path(
+        self, valid_skill_report: EvaluationReport, valid_skill_path: Path
+    ):
+        assert Path(valid_skill_report.skill_path) == valid_skill_path
+
+    @pytest.mark.parametrize(
+        ("attr", "predicate"),
+        [
+            ("skill_name", lambda v: v == "creating-reports"),
+            ("checks_run", lambda v: v > 0),
+            ("quality_score", lambda v: v > 0),
+            ("timestamp", bool),
+            ("duration_ms", lambda v: v >= 0),
+        ],
+    )
+    def test_evaluate_valid_skill(self, valid_skill_report: EvaluationReport, attr, predicate):
+        value = getattr(valid_skill_report, attr)
+        assert predicate(value), f"Unexpected {attr}: {value!r}"
 
     def test_evaluate_invalid_skill(self, evaluator: StaticEvaluator, invalid_skill_path: Path):
         report = evaluator.evaluate(invalid_skill_path)
@@ -24,9 +36,9 @@ class TestStaticEvaluator:
         assert not report.overall_pass
         assert report.checks_failed > 0
 
-    def test_evaluate_with_specific_checks(self, valid_skill_path: Path):
+    def test_evaluate_with_specific_checks(self, valid_skill: Skill):
         evaluator = StaticEvaluator(check_ids=["structure.skill-md-exists", "naming.required"])
-        report = evaluator.evaluate(valid_skill_path)
+        report = evaluator.evaluate_skill(valid_skill)
 
         assert report.checks_run == 2
         assert all(
@@ -46,10 +58,17 @@ class TestStaticEvaluator:
         assert not passed
         assert len(errors) > 0
 
-    def test_report_to_dict(self, evaluator: StaticEvaluator, valid_skill_path: Path):
-        report = evaluator.evaluate(valid_skill_path)
+    def test_evaluate_skill_matches_evaluate(
+        self, evaluator: StaticEvaluator, valid_skill: Skill, valid_skill_report: EvaluationReport
+    ):
+        report = evaluator.evaluate_skill(valid_skill)
+
+        assert report.skill_path == valid_skill_report.skill_path
+        assert report.results == valid_skill_report.results
+        assert report.quality_score == valid_skill_report.quality_score
 
-        report_dict = report.to_dict()
+    def test_report_to_dict(self, valid_skill_report: EvaluationReport):
+        report_dict = valid_skill_report.to_dict()
 
         assert isinstance(report_dict, dict)
         assert "skill_path" in report_dict
@@ -57,10 +76,10 @@ class TestStaticEvaluator:
         assert "results" in report_dict
         assert isinstance(report_dict["results"], list)
 
-    def test_evaluate_spec_only(self, valid_skill_path: Path):
+    def test_evaluate_spec_only(self, valid_skill: Skill):
         """Test that spec_only mode only runs spec-required checks."""
         evaluator = StaticEvaluator(spec_only=True)
-        report = evaluator.evaluate(valid_skill_path)
+        report = evaluator.evaluate_skill(valid_skill)
 
         # Should only run 10 spec-required checks
         assert report.checks_run == 10
@@ -81,10 +100,10 @@ class TestStaticEvaluator:
         result_ids = {r.check_id for r in report.results}
         assert result_ids == spec_required_ids
 
-    def test_evaluate_all_checks(self, valid_skill_path: Path):
+    def test_evaluate_all_checks(self, valid_skill: Skill):
         """Test that default mode runs all checks including quality suggestions."""
         evaluator = StaticEvaluator(spec_only=False)
-        report = evaluator.evaluate(valid_skill_path)
+        report = evaluator.evaluate_skill(valid_skill)
 
         # Should run all 19 checks
         assert report.checks_run == 19
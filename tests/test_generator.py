@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
-import yaml
+from typer.testing import CliRunner
 
+from skill_lab.cli import app
 from skill_lab.core.exceptions import GenerationError
+from skill_lab.core.utils import yaml_safe_load
 from skill_lab.triggers.generator import (
     DEFAULT_MODEL,
     MAX_BODY_CHARS,
+    SYSTEM_PROMPT_PREFIX,
+    GenerationUsage,
     TriggerGenerator,
 )
 
+runner = CliRunner()
+
 # Sample valid YAML that a model might return
 VALID_YAML_RESPONSE = """\
 skill: my-skill
@@ -76,6 +83,15 @@ test_cases:
     expected: no_trigger
 """
 
+# Parsed once; tests compare generated output against it
+VALID_YAML_DATA = yaml_safe_load(VALID_YAML_RESPONSE)
+
+# Minimal SKILL.md for tests that build a skill directory in tmp_path
+_SKILL_MD = "---\nname: my-skill\ndescription: A test skill\n---\n\nBody content"
+
+# Body long enough to be truncated in the prompt
+_LONG_BODY = "x" * (MAX_BODY_CHARS + 1000)
+
 
 def _mock_anthropic_response(text: str) -> MagicMock:
     """Create a mock Anthropic API response."""
@@ -86,20 +102,52 @@ def _mock_anthropic_response(text: str) -> MagicMock:
     return message
 
 
+# Final message for the default response; only read by the generator, so shared
+_DEFAULT_RESPONSE = _mock_anthropic_response(VALID_YAML_RESPONSE)
+
+
+def _mock_anthropic_stream(text: str, response: MagicMock | None = None) -> MagicMock:
+    """Create a mock Anthropic streaming response, delivering text in small chunks."""
+    stream = MagicMock()
+    stream.text_stream = iter([text[i : i + 16] for i in range(0, len(text), 16)])
+    stream.get_final_message.return_value = response or _mock_anthropic_response(text)
+    manager = MagicMock()
+    manager.__enter__.return_value = stream
+    return manager
+
+
 @pytest.fixture
 def mock_client() -> MagicMock:
     """Create a mock Anthropic client."""
     client = MagicMock()
-    client.messages.create.return_value = _mock_anthropic_response(VALID_YAML_RESPONSE)
+    client.messages.stream.return_value = _mock_anthropic_stream(
+        VALID_YAML_RESPONSE, _DEFAULT_RESPONSE
+    )
     return client
 
 
+@pytest.fixture
+def skill_dir(tmp_path: Path) -> Path:
+    """Create a minimal skill directory."""
+    skill_dir = tmp_path / "my-skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text(_SKILL_MD)
+    return skill_dir
+
+
+@pytest.fixture
+def existing_triggers(skill_dir: Path) -> Path:
+    """Create a minimal skill directory that already has a triggers.yaml."""
+    output_dir = skill_dir / ".skill-lab" / "tests"
+    output_dir.mkdir(parents=True)
+    (output_dir / "triggers.yaml").write_text("existing content")
+    return skill_dir
+
+
 @pytest.fixture
 def generator(mock_client: MagicMock) -> TriggerGenerator:
     """Create a TriggerGenerator with a mocked client."""
-    with patch("anthropic.Anthropic", return_value=mock_client):
-        gen = TriggerGenerator(api_key="test-key")
-    return gen
+    return TriggerGenerator(api_key="test-key", client=mock_client)
 
 
 class TestTriggerGenerator:
@@ -112,10 +160,10 @@ class TestTriggerGenerator:
         skill_path = fixtures_dir / "skills" / "creating-reports"
         result = generator.generate(skill_path)
 
-        data = yaml.safe_load(result)
+        data = yaml_safe_load(result)
         assert isinstance(data, dict)
         assert "skill" in data
-        assert "test_cases" in data
+        assert data["test_cases"] == VALID_YAML_DATA["test_cases"]
 
     def test_generate_forces_correct_skill_name(
         self, generator: TriggerGenerator, fixtures_dir: Path
@@ -124,7 +172,7 @@ class TestTriggerGenerator:
         skill_path = fixtures_dir / "skills" / "creating-reports"
         result = generator.generate(skill_path)
 
-        data = yaml.safe_load(result)
+        data = yaml_safe_load(result)
         assert data["skill"] == "creating-reports"
 
     def test_generate_all_four_types(
@@ -134,7 +182,7 @@ class TestTriggerGenerator:
         skill_path = fixtures_dir / "skills" / "creating-reports"
         result = generator.generate(skill_path)
 
-        data = yaml.safe_load(result)
+        data = yaml_safe_load(result)
         types = {tc["type"] for tc in data["test_cases"]}
         assert "explicit" in types
         assert "implicit" in types
@@ -142,55 +190,28 @@ class TestTriggerGenerator:
         assert "negative" in types
 
     def test_generate_and_write_creates_file(
-        self, generator: TriggerGenerator, tmp_path: Path
+        self, generator: TriggerGenerator, skill_dir: Path
     ) -> None:
         """Test that generate_and_write() creates the output file."""
-        # Set up a minimal skill directory
-        skill_dir = tmp_path / "my-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text(
-            "---\nname: my-skill\ndescription: A test skill\n---\n\nBody content"
-        )
-
         result_path = generator.generate_and_write(skill_dir)
 
         assert result_path.exists()
         assert result_path == skill_dir / ".skill-lab" / "tests" / "triggers.yaml"
-        data = yaml.safe_load(result_path.read_text())
+        data = yaml_safe_load(result_path.read_text())
         assert data["skill"] == "my-skill"
 
     def test_generate_and_write_raises_on_existing(
-        self, generator: TriggerGenerator, tmp_path: Path
+        self, generator: TriggerGenerator, existing_triggers: Path
     ) -> None:
         """Test that generate_and_write() raises FileExistsError if not forced."""
-        skill_dir = tmp_path / "my-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text(
-            "---\nname: my-skill\ndescription: A test skill\n---\n\nBody"
-        )
-        # Create existing file
-        output_dir = skill_dir / ".skill-lab" / "tests"
-        output_dir.mkdir(parents=True)
-        (output_dir / "triggers.yaml").write_text("existing content")
-
         with pytest.raises(FileExistsError, match="Use --force to overwrite"):
-            generator.generate_and_write(skill_dir)
+            generator.generate_and_write(existing_triggers)
 
     def test_generate_and_write_force_overwrites(
-        self, generator: TriggerGenerator, tmp_path: Path
+        self, generator: TriggerGenerator, existing_triggers: Path
     ) -> None:
         """Test that generate_and_write() overwrites with force=True."""
-        skill_dir = tmp_path / "my-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text(
-            "---\nname: my-skill\ndescription: A test skill\n---\n\nBody"
-        )
-        # Create existing file
-        output_dir = skill_dir / ".skill-lab" / "tests"
-        output_dir.mkdir(parents=True)
-        (output_dir / "triggers.yaml").write_text("existing content")
-
-        result_path = generator.generate_and_write(skill_dir, force=True)
+        result_path = generator.generate_and_write(existing_triggers, force=True)
         assert result_path.exists()
         content = result_path.read_text()
         assert "existing content" not in content
@@ -199,7 +220,7 @@ class TestTriggerGenerator:
         self, generator: TriggerGenerator, fixtures_dir: Path
     ) -> None:
         """Test error handling for malformed YAML response."""
-        generator._client.messages.create.return_value = _mock_anthropic_response(
+        generator._client.messages.stream.return_value = _mock_anthropic_stream(
             "this: is: not: valid: yaml:\n  - [broken"
         )
         skill_path = fixtures_dir / "skills" / "creating-reports"
@@ -212,14 +233,27 @@ class TestTriggerGenerator:
     ) -> None:
         """Test that markdown code fences are stripped from response."""
         fenced = f"```yaml\n{VALID_YAML_RESPONSE}\n```"
-        generator._client.messages.create.return_value = _mock_anthropic_response(fenced)
+        generator._client.messages.stream.return_value = _mock_anthropic_stream(fenced)
 
         skill_path = fixtures_dir / "skills" / "creating-reports"
         result = generator.generate(skill_path)
 
-        data = yaml.safe_load(result)
+        data = yaml_safe_load(result)
         assert "test_cases" in data
 
+    def test_generate_aborts_on_prose_response(
+        self, generator: TriggerGenerator, fixtures_dir: Path
+    ) -> None:
+        """Test that a non-YAML response is rejected from its first line."""
+        stream = _mock_anthropic_stream(f"Here are the trigger tests:\n{VALID_YAML_RESPONSE}")
+        generator._client.messages.stream.return_value = stream
+        skill_path = fixtures_dir / "skills" / "creating-reports"
+
+        with pytest.raises(GenerationError, match="not YAML"):
+            generator.generate(skill_path)
+        stream.__enter__.return_value.get_final_message.assert_not_called()
+        stream.__exit__.assert_called_once()
+
     def test_generate_parse_error(
         self, generator: TriggerGenerator, tmp_path: Path
     ) -> None:
@@ -231,6 +265,15 @@ class TestTriggerGenerator:
         with pytest.raises(GenerationError, match="Failed to parse skill"):
             generator.generate(skill_dir)
 
+    def test_uses_injected_client(self, mock_client: MagicMock, fixtures_dir: Path) -> None:
+        """Test that an injected client is used without constructing a new one."""
+        with patch("anthropic.Anthropic") as anthropic_cls:
+            gen = TriggerGenerator(client=mock_client)
+        gen.generate(fixtures_dir / "skills" / "creating-reports")
+
+        anthropic_cls.assert_not_called()
+        mock_client.messages.stream.assert_called_once()
+
 
 class TestPromptBuilding:
     """Tests for prompt construction."""
@@ -243,12 +286,11 @@ class TestPromptBuilding:
 
     def test_prompt_truncates_long_body(self, generator: TriggerGenerator) -> None:
         """Test that long body content is truncated."""
-        long_body = "x" * (MAX_BODY_CHARS + 1000)
-        prompt = generator._build_prompt("skill", "desc", long_body)
+        prompt = generator._build_prompt("skill", "desc", _LONG_BODY)
 
         assert "[... content truncated ...]" in prompt
         # Should not contain the full body
-        assert len(prompt) < len(long_body)
+        assert len(prompt) < len(_LONG_BODY)
 
     def test_prompt_preserves_short_body(self, generator: TriggerGenerator) -> None:
         """Test that short body content is preserved fully."""
@@ -258,68 +300,80 @@ class TestPromptBuilding:
         assert short_body in prompt
         assert "[... content truncated ...]" not in prompt
 
+    def test_system_prompt_includes_skill_instructions(
+        self, generator: TriggerGenerator, mock_client: MagicMock
+    ) -> None:
+        """Test that the API call sends the generate-triggers skill as system prompt."""
+        generator._call_api("prompt")
+
+        system = mock_client.messages.stream.call_args.kwargs["system"]
+        assert system.startswith(SYSTEM_PROMPT_PREFIX)
+        assert len(system) > len(SYSTEM_PROMPT_PREFIX)
+
 
 class TestYamlValidation:
     """Tests for YAML structure validation."""
 
+    def test_parse_response_validates(self, generator: TriggerGenerator) -> None:
+        """Test that parsed responses go through structure validation."""
+        with pytest.raises(GenerationError, match="missing 'test_cases' key"):
+            generator._parse_response("skill: test\nother_key: value", "test")
+
     def test_missing_test_cases_key(self, generator: TriggerGenerator) -> None:
         """Test validation catches missing test_cases."""
-        generator._client.messages.create.return_value = _mock_anthropic_response(
-            "skill: test\nother_key: value"
-        )
-
         with pytest.raises(GenerationError, match="missing 'test_cases' key"):
-            generator._parse_response("skill: test\nother_key: value", "test")
+            generator._validate_yaml_structure({"skill": "test", "other_key": "value"})
 
     def test_empty_test_cases(self, generator: TriggerGenerator) -> None:
         """Test validation catches empty test_cases list."""
         with pytest.raises(GenerationError, match="empty or invalid"):
-            generator._parse_response("skill: test\ntest_cases: []", "test")
+            generator._validate_yaml_structure({"skill": "test", "test_cases": []})
 
     def test_invalid_type(self, generator: TriggerGenerator) -> None:
         """Test validation catches invalid trigger type."""
-        yaml_str = (
-            "skill: test\ntest_cases:\n"
-            "  - id: t1\n    type: invalid\n    prompt: hi\n    expected: trigger"
-        )
+        case = {"id": "t1", "type": "invalid", "prompt": "hi", "expected": "trigger"}
         with pytest.raises(GenerationError, match="invalid type 'invalid'"):
-            generator._parse_response(yaml_str, "test")
+            generator._validate_yaml_structure({"skill": "test", "test_cases": [case]})
 
     def test_invalid_expected(self, generator: TriggerGenerator) -> None:
         """Test validation catches invalid expected value."""
-        yaml_str = (
-            "skill: test\ntest_cases:\n"
-            "  - id: t1\n    type: explicit\n    prompt: hi\n    expected: maybe"
-        )
+        case = {"id": "t1", "type": "explicit", "prompt": "hi", "expected": "maybe"}
         with pytest.raises(GenerationError, match="invalid expected 'maybe'"):
-            generator._parse_response(yaml_str, "test")
+            generator._validate_yaml_structure({"skill": "test", "test_cases": [case]})
 
     def test_missing_required_field(self, generator: TriggerGenerator) -> None:
         """Test validation catches missing required fields."""
-        yaml_str = (
-            "skill: test\ntest_cases:\n"
-            "  - id: t1\n    type: explicit\n    prompt: hi"
-        )
+        case = {"id": "t1", "type": "explicit", "prompt": "hi"}
         with pytest.raises(GenerationError, match="missing required field 'expected'"):
-            generator._parse_response(yaml_str, "test")
+            generator._validate_yaml_structure({"skill": "test", "test_cases": [case]})
 
 
-class TestGenerateCommand:
-    """Tests for the CLI generate command."""
+class TestGenerationUsage:
+    """Tests for token usage cost reporting."""
 
-    def test_missing_api_key(self, tmp_path: Path) -> None:
-        """Test error when ANTHROPIC_API_KEY is not set."""
-        from typer.testing import CliRunner
+    def test_cost_for_known_model(self) -> None:
+        """Test that costs use the per-million-token pricing table."""
+        usage = GenerationUsage(input_tokens=1_000_000, output_tokens=500_000, model=DEFAULT_MODEL)
+        input_price, output_price = GenerationUsage._PRICING[DEFAULT_MODEL]
 
-        from skill_lab.cli import app
+        assert usage.input_cost == pytest.approx(input_price)
+        assert usage.output_cost == pytest.approx(output_price / 2)
+        assert usage.total_cost == pytest.approx(input_price + output_price / 2)
 
-        skill_dir = tmp_path / "my-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text(
-            "---\nname: my-skill\ndescription: test\n---\n"
-        )
+    def test_cost_for_unknown_model(self) -> None:
+        """Test that costs are None when model pricing is unknown."""
+        usage = GenerationUsage(input_tokens=10, output_tokens=10, model="unknown-model")
 
-        runner = CliRunner()
+        assert usage.total_tokens == 20
+        assert usage.input_cost is None
+        assert usage.total_cost is None
+
+
+class TestGenerateCommand:
+    """Tests for the CLI generate command."""
+
+    def test_missing_api_key(self, skill_dir: Path) -> None:
+        """Test error when ANTHROPIC_API_KEY is not set."""
         result = runner.invoke(
             app, ["generate", str(skill_dir)], env={"ANTHROPIC_API_KEY": ""}
         )
@@ -328,48 +382,26 @@ class TestGenerateCommand:
 
     def test_nonexistent_path(self) -> None:
         """Test error for nonexistent path."""
-        from typer.testing import CliRunner
-
-        from skill_lab.cli import app
-
-        runner = CliRunner()
         result = runner.invoke(app, ["generate", "/nonexistent/path"])
         assert result.exit_code == 1
         assert "does not exist" in result.output
 
     def test_no_skill_md(self, tmp_path: Path) -> None:
         """Test error when SKILL.md is missing."""
-        from typer.testing import CliRunner
-
-        from skill_lab.cli import app
-
         empty_dir = tmp_path / "empty"
         empty_dir.mkdir()
 
-        runner = CliRunner()
         result = runner.invoke(app, ["generate", str(empty_dir)])
         assert result.exit_code == 1
         assert "No SKILL.md" in result.output
 
-    def test_missing_anthropic_package(self, tmp_path: Path) -> None:
-        """Test error when anthropic package is not installed."""
-        from typer.testing import CliRunner
-
-        from skill_lab.cli import app
-
-        skill_dir = tmp_path / "my-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text(
-            "---\nname: my-skill\ndescription: test\n---\n"
-        )
-
-        runner = CliRunner()
-        with patch(
-            "skill_lab.cli.importlib_import",
-            side_effect=ImportError("No module named 'anthropic'"),
-        ) if False else patch.dict("sys.modules", {"skill_lab.triggers.generator": None}):
-            # When generator module is None in sys.modules, importing will raise ImportError
-            pass
+    def test_missing_anthropic_package(
+        self, skill_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test error when the generator (and so anthropic) can't be imported."""
+        # A None entry in sys.modules makes the CLI's lazy import raise ImportError
+        monkeypatch.setitem(sys.modules, "skill_lab.triggers.generator", None)
 
-        # This test verifies the error path exists; full integration would need
-        # to actually remove the anthropic package, which we skip in unit tests.
+        result = runner.invoke(app, ["generate", str(skill_dir)])
+        assert result.exit_code == 1
+        assert "'anthropic' package is required" in result.output
@@ -0,0 +1,235 @@
+"""Tests for runtime adapters and trace parsing."""
+
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from skill_lab.runtimes.base import format_trace, resolve_cli
+from skill_lab.runtimes.claude_runtime import ClaudeRuntime
+from skill_lab.runtimes.codex_runtime import CodexRuntime
+
+
+def _install_fake_cli(bin_dir: Path, name: str, lines: list[str], stderr_size: int = 0) -> None:
+    """Install a fake runtime CLI on PATH that prints the given stdout lines."""
+    bin_dir.mkdir(exist_ok=True)
+    script = bin_dir / name
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"sys.stderr.write('x' * {stderr_size})\n"
+        f"for line in {lines!r}:\n"
+        "    sys.stdout.write(line + '\\n')\n"
+        "    sys.stdout.flush()\n"
+    )
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+
+
+def _write_jsonl(path: Path, events: list[dict]) -> Path:
+    """Write events as compact JSONL."""
+    path.write_text("\n".join(json.dumps(e) for e in events) + "\n")
+    return path
+
+
+class TestClaudeTraceParsing:
+    """Tests for ClaudeRuntime.parse_trace."""
+
+    def test_parse_compact_jsonl(self, tmp_path: Path) -> None:
+        trace = _write_jsonl(
+            tmp_path / "trace.jsonl",
+            [
+                {"type": "stream_event", "event": {"delta": "hi"}},
+                {"type": "tool_use", "name": "Bash", "input": {"command": "ls"}},
+                {"type": "tool_result", "tool_use_id": "1", "content": "a.txt"},
+            ],
+        )
+        events = list(ClaudeRuntime().parse_trace(trace))
+
+        assert [e.type for e in events] == ["item.started", "item.completed"]
+        assert events[0].item_type == "command_execution"
+        assert events[0].command == "ls"
+        assert events[1].output == "a.txt"
+
+    def test_parse_formatted_trace(self, valid_skill_path: Path) -> None:
+        trace = valid_skill_path / ".skill-lab" / "traces" / "scenario-1.jsonl"
+        events = list(ClaudeRuntime().parse_trace(trace))
+
+        assert events
+        assert events[0].raw["type"] == "system"
+        assert all(e.raw.get("type") != "stream_event" for e in events)
+
+    def test_parse_skips_compact_stream_events(self, tmp_path: Path) -> None:
+        trace = tmp_path / "trace.jsonl"
+        trace.write_text(
+            '{"type":"stream_event","event":{"delta":"hi"}}\n{"type":"result","result":"done"}\n'
+        )
+        events = list(ClaudeRuntime().parse_trace(trace))
+
+        assert [e.raw["type"] for e in events] == ["result"]
+
+    def test_parse_keeps_events_quoting_stream_event(self, tmp_path: Path) -> None:
+        # A stream_event marker inside a payload must not drop the event
+        trace = _write_jsonl(
+            tmp_path / "trace.jsonl",
+            [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": "1",
+                    "content": "x" * 100 + '"type":"stream_event"',
+                }
+            ],
+        )
+        events = list(ClaudeRuntime().parse_trace(trace))
+
+        assert [e.item_type for e in events] == ["tool_result"]
+
+    def test_parse_skips_invalid_utf8_without_orjson(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # The stdlib fallback must raise JSONDecodeError, not UnicodeDecodeError
+        monkeypatch.setattr("skill_lab.core.utils.orjson", None)
+        trace = tmp_path / "trace.jsonl"
+        trace.write_bytes(b'{"type":"result","result":"\xff"}\n{"type":"result","result":"done"}\n')
+        events = list(ClaudeRuntime().parse_trace(trace))
+
+        assert [e.raw["result"] for e in events] == ["done"]
+
+    def test_parse_missing_trace(self, tmp_path: Path) -> None:
+        assert list(ClaudeRuntime().parse_trace(tmp_path / "missing.jsonl")) == []
+
+    def test_format_trace(self, tmp_path: Path) -> None:
+        raw = '{"type": "result", "result": "ok"}\nnot json\n'
+        formatted = format_trace(raw)
+
+        assert formatted.startswith('{\n  "type": "result"')
+        assert "\n\nnot json\n" in formatted
+
+    def test_format_legacy_pretty_trace(self, valid_skill_path: Path) -> None:
+        trace = valid_skill_path / ".skill-lab" / "traces" / "scenario-1.jsonl"
+        raw = trace.read_text()
+        formatted = format_trace(raw)
+
+        blocks = formatted.rstrip("\n").split("\n\n")
+        objects = [json.loads(block) for block in blocks]
+        assert objects[0]["type"] == "system"
+        assert len(objects) == len(list(ClaudeRuntime()._iter_trace_chunks(trace)))
+        # Formatting an already formatted trace is a no-op
+        assert format_trace(formatted) == formatted
+
+
+class TestSkillTriggerDetection:
+    """Tests for real-time skill trigger detection."""
+
+    def test_claude_detects_skill_tool(self) -> None:
+        line = json.dumps(
+            {
+                "type": "assistant",
+                "message": {
+                    "content": [
+                        {"type": "tool_use", "name": "Skill", "input": {"skill": "my-skill"}}
+                    ]
+                },
+            }
+        ).encode()
+        assert ClaudeRuntime()._check_skill_trigger(line, "my-skill") is True
+        assert ClaudeRuntime()._check_skill_trigger(line, "other-skill") is False
+
+    def test_claude_ignores_malformed_line(self) -> None:
+        assert ClaudeRuntime()._check_skill_trigger(b"{not json", "my-skill") is False
+        assert ClaudeRuntime()._check_skill_trigger(b'{"x": "\xff my-skill"}', "my-skill") is False
+
+    def test_codex_detects_skill_invocation(self) -> None:
+        line = json.dumps(
+            {"type": "item.started", "item": {"type": "skill_invocation", "command": "my-skill"}}
+        ).encode()
+        assert CodexRuntime()._check_skill_trigger(line, "my-skill") is True
+
+    def test_codex_detects_dollar_reference(self) -> None:
+        line = json.dumps(
+            {"type": "item.completed", "item": {"type": "message", "text": "Using $my-skill now"}}
+        ).encode()
+        assert CodexRuntime()._check_skill_trigger(line, "my-skill") is True
+        assert CodexRuntime()._check_skill_trigger(line, "other-skill") is False
+
+    def test_codex_detects_nested_skill_prefix(self) -> None:
+        line = json.dumps(
+            {"type": "item.completed", "item": {"content": [{"text": "load skill:my-skill"}]}}
+        ).encode()
+        assert CodexRuntime()._check_skill_trigger(line, "my-skill") is True
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fake CLI relies on a shebang script")
+class TestExecute:
+    """Tests for runtime execution against a fake CLI."""
+
+    @pytest.fixture
+    def fake_bin(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        bin_dir = tmp_path / "bin"
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+        return bin_dir
+
+    def test_resolve_cli_follows_path(
+        self, tmp_path: Path, fake_bin: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _install_fake_cli(fake_bin, "claude", [])
+        assert resolve_cli("claude") == str(fake_bin / "claude")
+        assert ClaudeRuntime().is_available() is True
+
+        monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+        assert resolve_cli("claude") is None
+        assert ClaudeRuntime().is_available() is False
+
+    def test_execute_writes_compact_jsonl(self, tmp_path: Path, fake_bin: Path) -> None:
+        lines = ['{"type":"system","subtype":"init"}', '{"type":"result","result":"ok"}']
+        _install_fake_cli(fake_bin, "claude", lines)
+        trace_path = tmp_path / "traces" / "t1.jsonl"
+
+        exit_code = ClaudeRuntime().execute("hello", tmp_path, trace_path)
+
+        assert exit_code == 0
+        assert trace_path.read_text().splitlines() == lines
+
+    def test_execute_terminates_last_line(self, tmp_path: Path, fake_bin: Path) -> None:
+        fake_bin.mkdir()
+        script = fake_bin / "codex"
+        script.write_text(
+            f"#!{sys.executable}\nprint('{{\"a\": 1}}')\nprint()\nprint('{{}}', end='')\n"
+        )
+        script.chmod(script.stat().st_mode | stat.S_IXUSR)
+        trace_path = tmp_path / "t1.jsonl"
+
+        assert CodexRuntime().execute("hello", tmp_path, trace_path) == 0
+        assert trace_path.read_text() == '{"a": 1}\n{}\n'
+
+    def test_execute_ignores_large_stderr(self, tmp_path: Path, fake_bin: Path) -> None:
+        # More than a pipe buffer of stderr must not block the CLI
+        _install_fake_cli(fake_bin, "claude", ['{"type":"result"}'], stderr_size=256 * 1024)
+        trace_path = tmp_path / "t1.jsonl"
+
+        exit_code = ClaudeRuntime().execute("hello", tmp_path, trace_path)
+
+        assert exit_code == 0
+        assert trace_path.read_text() == '{"type":"result"}\n'
+
+    def test_execute_stops_on_skill(self, tmp_path: Path, fake_bin: Path) -> None:
+        skill_line = json.dumps(
+            {
+                "type": "assistant",
+                "message": {
+                    "content": [
+                        {"type": "tool_use", "name": "Skill", "input": {"skill": "my-skill"}}
+                    ]
+                },
+            }
+        )
+        lines = ['{"type":"system","subtype":"init"}', skill_line, '{"type":"result"}']
+        _install_fake_cli(fake_bin, "claude", lines)
+        trace_path = tmp_path / "t1.jsonl"
+
+        exit_code = ClaudeRuntime().execute("hello", tmp_path, trace_path, stop_on_skill="my-skill")
+
+        assert exit_code == 0
+        assert trace_path.read_text().splitlines() == lines[:2]
@@ -1,12 +1,64 @@
 """Unit tests for trigger testing functionality."""
 
+import threading
+import time
+from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from skill_lab.core.models import TraceEvent, TriggerType
+from skill_lab.core.models import (
+    TraceEvent,
+    TriggerExpectation,
+    TriggerTestCase,
+    TriggerType,
+)
+from skill_lab.runtimes.base import RuntimeAdapter
 from skill_lab.triggers.test_loader import load_trigger_tests
 from skill_lab.triggers.trace_analyzer import TraceAnalyzer
+from skill_lab.triggers.trigger_evaluator import (
+    TriggerEvaluator,
+    _find_project_root,
+    clear_caches,
+)
+
+
+class _FakeRuntime(RuntimeAdapter):
+    """Runtime that triggers the skill when the prompt mentions it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.active_at_start: dict[str, int] = {}
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    def execute(
+        self,
+        prompt: str,
+        skill_path: Path,
+        trace_path: Path,
+        stop_on_skill: str | None = None,
+        working_dir: Path | None = None,
+    ) -> int:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.active_at_start[prompt] = self.active
+        time.sleep(0.05)
+        trace_path.write_text("skill\n" if "$my-skill" in prompt else "")
+        with self._lock:
+            self.active -= 1
+        return 0
+
+    def parse_trace(self, trace_path: Path) -> Iterator[TraceEvent]:
+        yield TraceEvent(type="system", raw={"type": "system", "subtype": "init"})
+        if trace_path.read_text():
+            yield TraceEvent(type="item.started", item_type="skill_invocation", command="my-skill")
 
 
 class TestTriggerTestLoader:
@@ -252,3 +304,138 @@ class TestTriggerReport:
         assert report_dict["overall_pass"] is True
         assert len(report_dict["results"]) == 1
         assert "explicit" in report_dict["summary_by_type"]
+
+
+class TestTriggerEvaluator:
+    """Tests for TriggerEvaluator orchestration."""
+
+    @pytest.fixture
+    def skill_dir(self, tmp_path: Path) -> Path:
+        tests_dir = tmp_path / "my-skill" / ".skill-lab" / "tests"
+        tests_dir.mkdir(parents=True)
+        cases = "".join(
+            f"  - id: t{i}\n"
+            f"    type: {'explicit' if i % 2 == 0 else 'negative'}\n"
+            f'    prompt: "{"$my-skill go" if i % 2 == 0 else "unrelated"}"\n'
+            f"    expected: {'trigger' if i % 2 == 0 else 'no_trigger'}\n"
+            for i in range(6)
+        )
+        (tests_dir / "triggers.yaml").write_text(f"skill: my-skill\ntest_cases:\n{cases}")
+        return tmp_path / "my-skill"
+
+    def test_runs_tests_concurrently_in_order(self, skill_dir: Path) -> None:
+        runtime = _FakeRuntime()
+        evaluator = TriggerEvaluator(concurrency=3)
+        evaluator._get_runtime = lambda: runtime  # type: ignore[method-assign]
+        progress: list[int] = []
+
+        report = evaluator.evaluate(
+            skill_dir, progress_callback=lambda current, total, name: progress.append(current)
+        )
+
+        assert [r.test_id for r in report.results] == [f"t{i}" for i in range(6)]
+        assert report.overall_pass
+        assert 1 < runtime.max_active <= 3
+        assert sorted(progress) == [1, 2, 3, 4, 5, 6]
+        assert [r.events_count for r in report.results] == [2, 1, 2, 1, 2, 1]
+
+    def test_files_created_tests_run_alone(self, skill_dir: Path) -> None:
+        with (skill_dir / ".skill-lab" / "tests" / "triggers.yaml").open("a") as f:
+            f.write(
+                "  - id: writes\n"
+                "    type: explicit\n"
+                '    prompt: "$my-skill write"\n'
+                "    files_created: [out.txt]\n"
+            )
+        (skill_dir / "out.txt").write_text("")
+        runtime = _FakeRuntime()
+        evaluator = TriggerEvaluator(concurrency=3)
+        evaluator._get_runtime = lambda: runtime  # type: ignore[method-assign]
+
+        report = evaluator.evaluate(skill_dir)
+
+        assert [r.test_id for r in report.results][-1] == "writes"
+        assert report.overall_pass
+        assert runtime.max_active > 1
+        assert runtime.active_at_start["$my-skill write"] == 1
+
+    def test_concurrency_one_runs_serially(self, skill_dir: Path) -> None:
+        runtime = _FakeRuntime()
+        evaluator = TriggerEvaluator(concurrency=1)
+        evaluator._get_runtime = lambda: runtime  # type: ignore[method-assign]
+
+        report = evaluator.evaluate(skill_dir)
+
+        assert report.tests_run == 6
+        assert runtime.max_active == 1
+
+    def test_empty_filter_returns_empty_report(self, skill_dir: Path) -> None:
+        evaluator = TriggerEvaluator(runtime="claude")
+
+        report = evaluator.evaluate(skill_dir, type_filter=TriggerType.CONTEXTUAL)
+
+        assert report.tests_run == 0
+        assert report.overall_pass
+        assert report.runtime == "claude"
+        assert not (skill_dir / ".skill-lab" / "traces").exists()
+
+    def test_empty_filter_skips_runtime_detection(self, skill_dir: Path) -> None:
+        evaluator = TriggerEvaluator()
+        with patch.object(evaluator, "_resolve_runtime") as resolve:
+            report = evaluator.evaluate(skill_dir, type_filter=TriggerType.CONTEXTUAL)
+
+        resolve.assert_not_called()
+        assert report.tests_run == 0
+        assert report.runtime == "auto"
+
+    def test_runtime_resolved_once(self) -> None:
+        evaluator = TriggerEvaluator(runtime="claude")
+
+        runtime = evaluator._get_runtime()
+
+        assert runtime.name == "claude"
+        assert evaluator._get_runtime() is runtime
+
+    def test_find_project_root(self, tmp_path: Path) -> None:
+        clear_caches()
+        skill_dir = tmp_path / "project" / ".claude" / "skills" / "my-skill"
+        skill_dir.mkdir(parents=True)
+
+        root = _find_project_root(str(skill_dir.resolve()))
+
+        assert root == (tmp_path / "project").resolve()
+
+    def test_find_project_root_cache_clear(self, tmp_path: Path) -> None:
+        clear_caches()
+        skill_dir = str((tmp_path / "my-skill").resolve())
+        assert _find_project_root(skill_dir) is None
+
+        (tmp_path / ".claude" / "skills").mkdir(parents=True)
+        assert _find_project_root(skill_dir) is None  # cached
+
+        clear_caches()
+        assert _find_project_root(skill_dir) == tmp_path.resolve()
+
+    def test_check_expectations_skips_file_checks_after_loop(self, tmp_path: Path) -> None:
+        events = [
+            TraceEvent(type="item.completed", item_type="command_execution", command="ls")
+            for _ in range(4)
+        ]
+        analyzer = TraceAnalyzer(events)
+        analyzer.file_was_created = _fail_file_check  # type: ignore[method-assign]
+        test_case = TriggerTestCase(
+            id="t1",
+            name="t1",
+            skill_name="my-skill",
+            prompt="$my-skill go",
+            trigger_type=TriggerType.EXPLICIT,
+            expected=TriggerExpectation(
+                skill_triggered=True, files_created=("out.txt",), no_loops=True
+            ),
+        )
+
+        assert not TriggerEvaluator()._check_expectations(test_case, analyzer, tmp_path, True, 0)
+
+
+def _fail_file_check(filepath: str, skill_path: Path) -> bool:
+    raise AssertionError("file_was_created should not run")